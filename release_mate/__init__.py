@@ -1,4 +1,12 @@
-from . import api
+import importlib
 
 __version__ = "0.3.1"
 __all__ = ["api"]
+
+
+def __getattr__(name):
+    # Load the API on first access so that `release-mate --help` and shell
+    # completion do not import it up front
+    if name == "api":
+        return importlib.import_module(f"{__name__}.api")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,19 @@
+"""Entry point for the ``release-mate`` script and ``python -m release_mate``."""
+import sys
+
+
+def main() -> None:
+    """Run the command line interface, answering ``--version`` without loading Click."""
+    if sys.argv[1:] == ["--version"]:
+        from . import __version__
+
+        print(f"release-mate, version {__version__}")
+        return
+
+    from .cli import cli
+
+    cli(prog_name="release-mate")
+
+
+if __name__ == '__main__':
+    main()
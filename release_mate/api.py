@@ -1,24 +1,38 @@
 """Command line interface for release-mate tool."""
 
+from __future__ import annotations
+
+import concurrent.futures
 import contextlib
 import dataclasses
+import functools
+import hashlib
+import io
+import json
+import mmap
 import os
 import re
+import shutil
 import subprocess
 import sys
+import tempfile
 import traceback
 import typing
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
+
+# git, cookiecutter and rich are imported where they are used so that shell
+# completion and --help do not pay for loading them.
+if typing.TYPE_CHECKING:
+    import git
+    from rich.console import Console
 
-import git
-from cookiecutter.main import cookiecutter
-from git.exc import GitCommandError
-from rich import print as rprint
-from rich.console import Console
-from rich.panel import Panel
+# Section header naming the release branch, e.g.
+# [tool.semantic_release.branches.main]
+_BRANCH_RE = re.compile(r'\s*\[.*semantic_release\.branches\.(\w+)\]')
 
-console = Console()
+# Remote host of an SSH (git@host:path, ssh://git@host/path) or HTTP(S) remote
+_REMOTE_RE = re.compile(r'^(?:(?:ssh://)?git@([^:/]+)|(https?)://([^/]+))')
 
 
 @dataclasses.dataclass
@@ -35,6 +49,154 @@ class ProjectConfig:
         return dataclasses.asdict(self)
 
 
+@functools.lru_cache(maxsize=1)
+def _console() -> Console:
+    """
+    Get the shared rich console, creating it on first use.
+
+    Returns:
+        Console: Rich console object
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.lru_cache(maxsize=1)
+def _find_repo_root(start: str) -> Optional[str]:
+    """
+    Find the root of the git working tree enclosing a directory.
+
+    Walks up from ``start`` looking for a ``.git`` entry (a directory, or a
+    file for worktrees and submodules) without importing GitPython or
+    spawning git. The result is memoized for the lifetime of the process.
+
+    Args:
+        start (str): Directory to start the search from
+
+    Returns:
+        Optional[str]: The working tree root, or None if not inside a repository
+    """
+    current = os.path.abspath(start)
+    while True:
+        if os.path.exists(os.path.join(current, '.git')):
+            return current
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def _git_dir(repo_root: str) -> Optional[str]:
+    """
+    Locate the git directory of a working tree without spawning git.
+
+    Follows the ``gitdir:`` pointer that worktrees and submodules use in
+    place of a ``.git`` directory.
+
+    Args:
+        repo_root (str): Root of the git working tree
+
+    Returns:
+        Optional[str]: Path to the git directory, or None if it cannot be determined
+    """
+    git_dir = os.path.join(repo_root, '.git')
+    if not os.path.isfile(git_dir):
+        return git_dir
+    try:
+        with open(git_dir, encoding='utf-8') as f:
+            pointer = f.read().strip()
+    except OSError:
+        return None
+    if not pointer.startswith('gitdir:'):
+        return None
+    return os.path.join(repo_root, pointer[len('gitdir:'):].strip())
+
+
+def _current_branch(repo_root: str) -> Optional[str]:
+    """
+    Read the name of the checked-out branch straight from ``.git/HEAD``.
+
+    Callers fall back to GitPython when this returns None.
+
+    Args:
+        repo_root (str): Root of the git working tree
+
+    Returns:
+        Optional[str]: The branch name, or None on a detached HEAD or unreadable HEAD file
+    """
+    git_dir = _git_dir(repo_root)
+    if git_dir is None:
+        return None
+    try:
+        with open(os.path.join(git_dir, 'HEAD'), encoding='utf-8') as f:
+            head = f.read().strip()
+    except OSError:
+        return None
+    if head.startswith('ref: refs/heads/'):
+        return head[len('ref: refs/heads/'):]
+    return None
+
+
+def _remote_url(repo_root: str, remote: str = 'origin') -> Optional[str]:
+    """
+    Read the first URL of a remote straight from the repository's config file.
+
+    Linked worktrees share the config of the main repository, which is
+    found through their ``commondir`` file. Callers fall back to GitPython
+    when this returns None.
+
+    Args:
+        repo_root (str): Root of the git working tree
+        remote (str): Name of the remote
+
+    Returns:
+        Optional[str]: The remote URL, or None if it is not configured or the config is unreadable
+    """
+    git_dir = _git_dir(repo_root)
+    if git_dir is None:
+        return None
+    try:
+        with open(os.path.join(git_dir, 'commondir'), encoding='utf-8') as f:
+            git_dir = os.path.join(git_dir, f.read().strip())
+    except OSError:
+        pass
+
+    section = f'[remote "{remote}"]'
+    in_section = False
+    try:
+        with open(os.path.join(git_dir, 'config'), encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith('['):
+                    in_section = line == section
+                elif in_section:
+                    key, sep, value = line.partition('=')
+                    if sep and key.strip().lower() == 'url':
+                        return value.strip()
+    except OSError:
+        return None
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_repo(repo_root: str) -> git.Repo:
+    """
+    Open the git repository at the given working tree root.
+
+    The result is memoized per root for the lifetime of the process.
+
+    Args:
+        repo_root (str): Root of the git working tree
+
+    Returns:
+        git.Repo: Git repository object
+    """
+    import git
+
+    return git.Repo(repo_root)
+
+
 def validate_git_repository() -> git.Repo:
     """
     Validate if the current directory is a git repository.
@@ -42,8 +204,13 @@ def validate_git_repository() -> git.Repo:
     Returns:
         git.Repo: Git repository object
     """
+    import git
+
+    repo_root = _find_repo_root(os.getcwd())
     try:
-        return git.Repo(os.getcwd(), search_parent_directories=True)
+        if repo_root is None:
+            raise git.InvalidGitRepositoryError(os.getcwd())
+        return _discover_repo(repo_root)
     except git.InvalidGitRepositoryError:
         display_panel_message(
             "Error",
@@ -53,37 +220,44 @@ def validate_git_repository() -> git.Repo:
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=8)
 def get_git_info(repo: git.Repo) -> typing.Tuple[str, str, str, str]:
     """
     Get git repository information.
 
+    Results are cached per repository; call ``get_git_info.cache_clear()`` after
+    switching branches.
+
     Args:
         repo (git.Repo): Git repository object
 
     Returns:
         tuple[str, str, str, str]: Current branch name, remote URL, domain in format protocol://domain.tld, and repo root path
     """
-    branch = repo.active_branch.name
+    from git.exc import GitCommandError
+
+    branch = _current_branch(repo.working_tree_dir) or repo.active_branch.name
     remote_url = ""
     domain = ""
     try:
-        remote_url = next(repo.remote().urls)
+        remote_url = _remote_url(repo.working_tree_dir) or next(iter(repo.remote().urls))
         # Extract domain from remote URL
-        if remote_url:
-            if remote_url.startswith('git@'):
+        remote_match = _REMOTE_RE.match(remote_url)
+        if remote_match:
+            ssh_host, scheme, http_host = remote_match.groups()
+            if ssh_host:
                 # SSH format: git@github.com:user/repo.git
-                domain = 'https://' + remote_url.split('@')[1].split(':')[0]
-            elif remote_url.startswith('https://') or remote_url.startswith('http://'):
+                domain = 'https://' + ssh_host
+            else:
                 # HTTPS format: https://github.com/user/repo.git
-                domain = remote_url.split(
-                    '/')[0] + '//' + remote_url.split('/')[2]
+                domain = f"{scheme}://{http_host}"
     except (StopIteration, GitCommandError) as e:
         display_panel_message(
             "Error", f"Error retrieving remote URL: {e}", "red")
         # Return default values
-        return branch, "", "", repo.git.rev_parse("--show-toplevel")
+        return branch, "", "", repo.working_tree_dir
 
-    return branch, remote_url, domain, repo.git.rev_parse("--show-toplevel")
+    return branch, remote_url, domain, repo.working_tree_dir
 
 
 def get_relative_path(root_path: str, target_path: str) -> str:
@@ -104,9 +278,9 @@ def get_normalized_project_dir(project_dir: str, repo_root: str) -> str:
     """
     Get the normalized project directory.
     """
-    dir = get_relative_path(repo_root, Path(project_dir).absolute(
-    ).as_posix()) if project_dir == "." else project_dir
-    if not os.path.exists(Path(repo_root) / dir):
+    dir = get_relative_path(repo_root, os.path.abspath(project_dir)
+                            ) if project_dir == "." else project_dir
+    if not os.path.exists(os.path.join(repo_root, dir)):
         display_panel_message(
             "Error",
             f"Project directory {dir!r} does not exist",
@@ -116,15 +290,54 @@ def get_normalized_project_dir(project_dir: str, repo_root: str) -> str:
     return dir
 
 
+# Panels deferred by batch_panels(); None when output is not being batched
+_pending_panels: Optional[list] = None
+
+
+@contextlib.contextmanager
+def batch_panels() -> Iterator[None]:
+    """
+    Defer panel output and render all panels together on exit.
+
+    Panels are flushed even when the block raises or exits, so messages
+    displayed before an error are not lost. Nested uses are folded into the
+    outermost one.
+    """
+    global _pending_panels
+    if _pending_panels is not None:
+        yield
+        return
+
+    _pending_panels = []
+    try:
+        yield
+    finally:
+        panels, _pending_panels = _pending_panels, None
+        if panels:
+            from rich import print as rprint
+            from rich.console import Group
+
+            rprint(Group(*panels))
+
+
 def display_panel_message(title: str, message: str, color: str = "green"):
-    rprint(Panel.fit(
+    from rich import print as rprint
+    from rich.panel import Panel
+
+    panel = Panel.fit(
         message,
         title=title,
         border_style=color
-    ))
+    )
+    if _pending_panels is not None:
+        _pending_panels.append(panel)
+    else:
+        rprint(panel)
 
 
 def create_git_tag(tag: str):
+    from git.exc import GitCommandError
+
     repo = validate_git_repository()
     try:
         repo.git.tag(tag)
@@ -141,8 +354,13 @@ def get_project_config(project_id: str, project_dir: str) -> ProjectConfig:
     branch, remote_url, domain, repo_root = get_git_info(repo)
     project_id = project_id or branch
     project_dir = get_normalized_project_dir(project_dir, repo_root)
-    poetry_syntax = any(os.path.exists(Path(project_dir) / _x)
-                        for _x in {'pyproject.toml', 'poetry.lock'})
+    # One directory listing instead of a stat() per candidate file
+    poetry_files = {'pyproject.toml', 'poetry.lock'}
+    try:
+        with os.scandir(Path(repo_root) / project_dir) as entries:
+            poetry_syntax = any(entry.name in poetry_files for entry in entries)
+    except OSError:
+        poetry_syntax = False
     return ProjectConfig(
         project_id=project_id,
         project_directory=project_dir,
@@ -166,14 +384,77 @@ def validate_config_file(project_id, config):
     return config_file
 
 
-def run_semantic_release(config_file: Path, args: List[str], repo_path: str) -> None:
+@functools.lru_cache(maxsize=1)
+def _semantic_release_entrypoint():
+    """
+    Import the semantic-release command line entrypoint once per process.
+
+    Returns:
+        Optional[click.Command]: The entrypoint, or None if semantic-release cannot be imported
+    """
+    try:
+        from semantic_release.cli.commands.main import main
+    except ImportError:
+        return None
+    return main
+
+
+def _run_semantic_release_in_process(cmd: List[str], repo_path: str) -> subprocess.CompletedProcess:
+    """
+    Run a semantic-release command inside the current interpreter.
+
+    Behaves like ``subprocess.run(cmd, check=True, capture_output=True, text=True, cwd=repo_path)``
+    but skips the interpreter start-up. Falls back to a subprocess when
+    semantic-release cannot be imported. semantic-release reads the repository
+    from the working directory, so this changes the process directory for the
+    duration of the call and must not be used from worker threads.
+
+    Args:
+        cmd (List[str]): The semantic-release command line, including the program name
+        repo_path (str): Path to the git repository root
+
+    Returns:
+        subprocess.CompletedProcess: The captured result of the command
+    """
+    entrypoint = _semantic_release_entrypoint()
+    if entrypoint is None:
+        return subprocess.run(cmd, check=True, capture_output=True, text=True, cwd=repo_path)
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    current_dir = os.getcwd()
+    os.chdir(repo_path)
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            result = entrypoint.main(
+                args=cmd[1:], prog_name=cmd[0], standalone_mode=False)
+        returncode = result if isinstance(result, int) else 0
+    except SystemExit as e:
+        returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+    except Exception as e:
+        stderr.write(f"{e}\n")
+        returncode = 1
+    finally:
+        os.chdir(current_dir)
+
+    if returncode:
+        raise subprocess.CalledProcessError(
+            returncode, cmd, stdout.getvalue(), stderr.getvalue())
+    return subprocess.CompletedProcess(cmd, 0, stdout.getvalue(), stderr.getvalue())
+
+
+def run_semantic_release(config_file: Path, args: List[str], repo_path: str, in_process: bool = False) -> None:
     """
     Run semantic-release command with the given configuration file and arguments.
 
+    Output is streamed to the terminal as it is produced, except inside
+    :func:`batch_panels` or when running in-process, where it is captured and
+    shown in a panel.
+
     Args:
         config_file (Path): Path to the semantic-release configuration file
         args (List[str]): List of arguments to pass to semantic-release
         repo_path (str): Path to the git repository root
+        in_process (bool): Run semantic-release inside the current interpreter instead of a subprocess
     """
     # Split args into pre-version and post-version args
     pre_version_args = []
@@ -188,14 +469,18 @@ def run_semantic_release(config_file: Path, args: List[str], repo_path: str) ->
     cmd = ["semantic-release", "-c",
            str(config_file)] + pre_version_args + ["version"] + post_version_args
 
-    # Store current directory
-    current_dir = os.getcwd()
     try:
-        # Change to repo directory
-        os.chdir(repo_path)
-
-        result = subprocess.run(
-            cmd, check=True, capture_output=True, text=True)
+        if in_process:
+            result = _run_semantic_release_in_process(cmd, repo_path)
+        elif _pending_panels is None:
+            # Let the output reach the terminal as it is produced instead of
+            # holding it back until semantic-release exits
+            subprocess.run(cmd, check=True, cwd=repo_path)
+            return
+        else:
+            # Batched panels are rendered together, so keep the output with them
+            result = subprocess.run(
+                cmd, check=True, capture_output=True, text=True, cwd=repo_path)
         if result.stdout:
             if _is_print_flag_set(args):
                 print(result.stdout)
@@ -217,38 +502,93 @@ def run_semantic_release(config_file: Path, args: List[str], repo_path: str) ->
     except subprocess.CalledProcessError as e:
         display_panel_message(
             "Error",
-            f"Failed to run semantic-release: {e.stderr}",
+            f"Failed to run semantic-release: {e.stderr or f'exit status {e.returncode}'}",
             "red"
         )
         sys.exit(1)
-    finally:
-        # Always restore original directory
-        os.chdir(current_dir)
 
 
-def get_available_project_ids() -> List[str]:
+def _iter_project_configs(release_mate_dir: Path) -> Iterator[Tuple[str, Path]]:
+    """
+    Iterate over the project configuration files in a .release-mate directory.
+
+    Args:
+        release_mate_dir (Path): Path to the .release-mate directory
+
+    Yields:
+        Tuple[str, Path]: The project ID and the path to its configuration file
+    """
+    try:
+        entries = os.scandir(release_mate_dir)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.endswith('.toml') and entry.is_file():
+                yield entry.name[:-5], Path(entry.path)
+
+
+def _completion_cache_file(repo_root: str) -> Path:
+    """
+    Get the path of the on-disk project ID cache for a repository.
+
+    Args:
+        repo_root (str): Git repository root path
+
+    Returns:
+        Path: Path to the cache file under $XDG_CACHE_HOME (or ~/.cache)
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    digest = hashlib.sha1(repo_root.encode()).hexdigest()[:16]
+    return Path(cache_home) / 'release-mate' / f'completions-{digest}.json'
+
+
+def _cached_project_ids(repo_root: str) -> List[str]:
     """
-    Get list of available project IDs from .release-mate directory.
+    Get the project IDs of a repository, reusing the on-disk cache when valid.
+
+    The cache is keyed on the modification time of the .release-mate
+    directory, which changes whenever a project file is added, removed or
+    renamed.
+
+    Args:
+        repo_root (str): Git repository root path
 
     Returns:
         List[str]: List of project IDs
     """
+    release_mate_dir = _release_mate_dir(repo_root)
     try:
-        repo = validate_git_repository()
-        _, _, _, repo_root = get_git_info(repo)
-        release_mate_dir = Path(repo_root) / '.release-mate'
+        mtime_ns = os.stat(release_mate_dir).st_mtime_ns
+    except OSError:
+        return []
 
-        if not release_mate_dir.exists():
-            return []
+    cache_file = _completion_cache_file(repo_root)
+    with contextlib.suppress(OSError, ValueError, KeyError, TypeError):
+        cached = json.loads(cache_file.read_text())
+        if cached['mtime_ns'] == mtime_ns:
+            return cached['project_ids']
 
-        return [f.stem for f in release_mate_dir.glob('*.toml')]
-    except Exception:
-        return []
+    project_ids = [project_id for project_id, _ in _iter_project_configs(release_mate_dir)]
+    with contextlib.suppress(OSError):
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so a concurrent reader never sees
+        # a partial cache
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'mtime_ns': mtime_ns, 'project_ids': project_ids}, f)
+        os.replace(tmp_path, cache_file)
+    return project_ids
 
 
 def project_id_completion(ctx, param, incomplete):
     """Shell completion for project IDs."""
-    return [id for id in get_available_project_ids() if id.startswith(incomplete)]
+    # Completion runs on every TAB press, so stay clear of GitPython
+    repo_root = _find_repo_root(os.getcwd())
+    if repo_root is None:
+        return []
+    return [id for id in _cached_project_ids(repo_root) if id.startswith(incomplete)]
 
 
 def version_worker(
@@ -270,7 +610,9 @@ def version_worker(
     as_prerelease: bool = False,
     prerelease_token: Optional[str] = None,
     build_metadata: Optional[str] = None,
-    skip_build: bool = False
+    skip_build: bool = False,
+    in_process: bool = False,
+    _ctx: Optional[tuple] = None
 ) -> None:
     """
     Core worker function for performing version bumps.
@@ -295,10 +637,16 @@ def version_worker(
         prerelease_token (Optional[str]): Force the next version to use this prerelease token
         build_metadata (Optional[str]): Build metadata to append to the new version
         skip_build (bool): Skip building the current project
+        in_process (bool): Run semantic-release inside the current interpreter instead of a subprocess
+        _ctx (Optional[tuple]): Precomputed (repo, branch, repo_root) from a caller that already
+            resolved them, such as batch_version_worker
     """
     try:
-        repo = validate_git_repository()
-        branch, _, _, repo_root = get_git_info(repo)
+        if _ctx is None:
+            repo = validate_git_repository()
+            branch, _, _, repo_root = get_git_info(repo)
+        else:
+            repo, branch, repo_root = _ctx
         project_id = project_id or branch
 
         # Check if project config exists
@@ -366,10 +714,11 @@ def version_worker(
                 "blue"
             )
 
-        run_semantic_release(config_file, args, repo_root)
+        run_semantic_release(config_file, args, repo_root,
+                             in_process=in_process)
 
     except Exception:
-        console.print_exception()
+        _console().print_exception()
         sys.exit(1)
 
 
@@ -386,6 +735,21 @@ def _is_print_flag_set(args: List[str]) -> bool:
     return any("--print" in arg for arg in args)
 
 
+@functools.lru_cache(maxsize=4)
+def _release_mate_dir(repo_root: str) -> Path:
+    """
+    Get the path to the .release-mate directory of a repository.
+
+    Args:
+        repo_root (str): Git repository root path
+
+    Returns:
+        Path: Path to the .release-mate directory
+    """
+    return Path(repo_root) / '.release-mate'
+
+
+@functools.lru_cache(maxsize=128)
 def get_project_config_file(project_id: str, repo_root: str) -> Path:
     """
     Get the path to the project's configuration file.
@@ -397,7 +761,7 @@ def get_project_config_file(project_id: str, repo_root: str) -> Path:
     Returns:
         Path: Path to the project's configuration file
     """
-    return Path(repo_root) / '.release-mate' / f"{project_id}.toml"
+    return _release_mate_dir(repo_root) / f"{project_id}.toml"
 
 
 def run_semantic_release_changelog(config_file: Path, args: List[str], repo_path: str) -> None:
@@ -422,14 +786,13 @@ def run_semantic_release_changelog(config_file: Path, args: List[str], repo_path
     cmd = ["semantic-release", "-c",
            str(config_file)] + pre_command_args + ["changelog"] + post_command_args
 
-    # Store current directory
-    current_dir = os.getcwd()
     try:
-        # Change to repo directory
-        os.chdir(repo_path)
-
+        if _pending_panels is None:
+            # Let the output reach the terminal as it is produced
+            subprocess.run(cmd, check=True, cwd=repo_path)
+            return
         result = subprocess.run(
-            cmd, check=True, capture_output=True, text=True)
+            cmd, check=True, capture_output=True, text=True, cwd=repo_path)
         if result.stdout:
             display_panel_message(
                 "Changelog Logs",
@@ -445,13 +808,10 @@ def run_semantic_release_changelog(config_file: Path, args: List[str], repo_path
     except subprocess.CalledProcessError as e:
         display_panel_message(
             "Error",
-            f"Failed to run semantic-release changelog: {e.stderr}",
+            f"Failed to run semantic-release changelog: {e.stderr or f'exit status {e.returncode}'}",
             "red"
         )
         sys.exit(1)
-    finally:
-        # Always restore original directory
-        os.chdir(current_dir)
 
 
 def get_config_file(project_id, repo_root):
@@ -462,6 +822,32 @@ def get_config_file(project_id, repo_root):
     )
 
 
+@functools.lru_cache(maxsize=256)
+def _identify_branch_cached(path_str: str, mtime_ns: int, size: int) -> Optional[str]:
+    """
+    Read a project configuration file and extract its branch.
+
+    The modification time and size are part of the cache key so that an
+    edited configuration file is re-read on the next lookup.
+
+    Args:
+        path_str (str): Path to the project configuration file
+        mtime_ns (int): Modification time of the file in nanoseconds
+        size (int): Size of the file in bytes
+
+    Returns:
+        Optional[str]: The branch name if found, otherwise None
+    """
+    with contextlib.suppress(Exception):
+        with open(path_str, 'r') as f:
+            # Section headers sit on their own line; stop at the first match
+            for line in f:
+                branch_match = _BRANCH_RE.match(line)
+                if branch_match:
+                    return branch_match[1]
+    return None
+
+
 def identify_branch(config_file: Path) -> Optional[str]:
     """
     Parse a project configuration file to extract the branch.
@@ -472,15 +858,16 @@ def identify_branch(config_file: Path) -> Optional[str]:
     Returns:
         Optional[str]: The branch name if found, otherwise None
     """
-    with contextlib.suppress(Exception):
-        with open(config_file, 'r') as f:
-            content = f.read()
-            # Look for the branch match pattern
-            branch_match = re.search(
-                r'\[.*semantic_release\.branches\.(\w+)\]', content)
-            if branch_match:
-                return branch_match[1]
-    return None
+    try:
+        stat = os.stat(config_file)
+    except OSError:
+        return None
+    return _identify_branch_cached(str(config_file), stat.st_mtime_ns, stat.st_size)
+
+
+# semantic-release version flags, in the order of build_version_args' parameters
+_BUMP_FLAGS = ("--major", "--minor", "--patch", "--prerelease")
+_OPT_OUT_FLAGS = ("--no-commit", "--no-tag", "--no-changelog", "--no-push", "--no-vcs-release")
 
 
 def build_version_args(
@@ -516,27 +903,16 @@ def build_version_args(
     Returns:
         List[str]: The constructed list of arguments.
     """
-    args = []
-    if noop:
-        args.append("--noop")
-    if major:
-        args.append("--major")
-    elif minor:
-        args.append("--minor")
-    elif patch:
-        args.append("--patch")
-    elif prerelease:
-        args.append("--prerelease")
-    if not commit:
-        args.append("--no-commit")
-    if not tag:
-        args.append("--no-tag")
-    if not changelog:
-        args.append("--no-changelog")
-    if not push:
-        args.append("--no-push")
-    if not vcs_release:
-        args.append("--no-vcs-release")
+    args = ["--noop"] if noop else []
+    # Version bumps are mutually exclusive; the first one set wins
+    args.extend(next(
+        ([flag] for flag, enabled in zip(_BUMP_FLAGS, (major, minor, patch, prerelease)) if enabled),
+        []
+    ))
+    args.extend(
+        flag for flag, enabled in zip(_OPT_OUT_FLAGS, (commit, tag, changelog, push, vcs_release))
+        if not enabled
+    )
     if as_prerelease:
         args.append("--as-prerelease")
     if prerelease_token:
@@ -584,10 +960,92 @@ def changelog_worker(project_id: str, post_to_release_tag: Optional[str], noop:
         run_semantic_release_changelog(config_file, args, repo_root)
 
     except Exception:
-        console.print_exception()
+        _console().print_exception()
         sys.exit(1)
 
 
+def _dry_run_version_in_worktree(repo: git.Repo, project_id: str, branch: str, args: List[str]) -> None:
+    """
+    Dry-run a version bump for one project in a temporary worktree of its branch.
+
+    The shared working tree is never checked out, so several projects can be
+    processed concurrently.
+
+    Args:
+        repo (git.Repo): Git repository object
+        project_id (str): Project identifier
+        branch (str): Branch the project is released from
+        args (List[str]): List of arguments to pass to semantic-release
+    """
+    from git.exc import GitCommandError
+
+    worktree = tempfile.mkdtemp(prefix="release-mate-")
+    try:
+        # --force lets a branch that is already checked out be added again;
+        # safe here because dry runs never commit.
+        repo.git.worktree("add", "--force", worktree, branch)
+
+        config_file = get_project_config_file(project_id, worktree)
+        if not config_file.exists():
+            raise FileNotFoundError(
+                f"Project {project_id!r} does not exist in .release-mate directory on branch {branch!r}")
+
+        display_panel_message(
+            "Batch Version",
+            f"Processing project [bold green]{project_id}[/bold green] on branch [bold blue]{branch}[/bold blue] (dry run)",
+            "blue"
+        )
+        run_semantic_release(config_file, args, worktree)
+    finally:
+        with contextlib.suppress(GitCommandError):
+            repo.git.worktree("remove", "--force", worktree)
+        shutil.rmtree(worktree, ignore_errors=True)
+
+
+def _dry_run_batch(repo: git.Repo, projects: List[typing.Tuple[str, str]],
+                   args: List[str]) -> typing.Tuple[List[str], int]:
+    """
+    Dry-run version bumps for several projects in parallel.
+
+    A project that exits (for example because semantic-release failed) does
+    not stop the others; its exit status is reported once all have finished.
+
+    Args:
+        repo (git.Repo): Git repository object
+        projects (List[tuple[str, str]]): Project identifiers paired with their branches
+        args (List[str]): List of arguments to pass to semantic-release
+
+    Returns:
+        tuple[List[str], int]: Error messages for the projects that failed, and the
+            highest exit status any project exited with (0 if none did)
+    """
+    errors = []
+    exit_code = 0
+    if not projects:
+        return errors, exit_code
+
+    # Each run is dominated by the semantic-release subprocess, so a handful
+    # of threads is enough to overlap them
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(projects))) as executor:
+        futures = {
+            executor.submit(_dry_run_version_in_worktree, repo, project_id, branch, args): project_id
+            for project_id, branch in projects
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                future.result()
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else 1
+                if code:
+                    exit_code = max(exit_code, code)
+                    errors.append(
+                        f"Project {futures[future]} exited with status {code}")
+            except Exception:
+                errors.append(
+                    f"Error processing project {futures[future]}: {traceback.format_exc()}")
+    return errors, exit_code
+
+
 def batch_version_worker(noop: bool,
                          major: bool,
                          minor: bool,
@@ -598,52 +1056,42 @@ def batch_version_worker(noop: bool,
                          changelog: bool,
                          push: bool):
     try:
-        repo = validate_git_repository()
-        _, _, _, repo_root = get_git_info(repo)
-        release_mate_dir = Path(repo_root) / '.release-mate'
-
-        # Validate version flags
-        version_flags = [major, minor, patch, prerelease]
-        if sum(version_flags) > 1:
-            display_panel_message(
-                "Error",
-                "Only one version type flag can be specified at a time",
-                "red"
-            )
-            sys.exit(1)
-
-        # Track errors
-        errors = []
-        current_branch = repo.active_branch.name
-
-        # Iterate through all project configuration files
-        for config_file in release_mate_dir.glob('*.toml'):
-            project_id = config_file.stem
-            branch = identify_branch(config_file)
-
-            if not branch:
-                errors.append(
-                    f"Could not determine branch for project {project_id}")
-                continue
-
-            try:
-                # Switch to the target branch
-                repo.git.checkout(branch)
-
+        # Render all panels of the batch in one pass
+        with batch_panels():
+            repo = validate_git_repository()
+            _, _, _, repo_root = get_git_info(repo)
+            release_mate_dir = _release_mate_dir(repo_root)
+
+            # Validate version flags
+            version_flags = [major, minor, patch, prerelease]
+            if sum(version_flags) > 1:
                 display_panel_message(
-                    "Batch Version",
-                    f"Processing project [bold green]{project_id}[/bold green] on branch [bold blue]{branch}[/bold blue]",
-                    "blue"
+                    "Error",
+                    "Only one version type flag can be specified at a time",
+                    "red"
                 )
-
-                # Call version_worker function directly
-                version_worker(
-                    project_id=project_id,
+                sys.exit(1)
+
+            # Track errors and the exit status of projects that exited
+            errors = []
+            exit_code = 0
+
+            # Resolve the branch of every project configuration file
+            projects = []
+            for project_id, config_file in _iter_project_configs(release_mate_dir):
+                branch = identify_branch(config_file)
+
+                if not branch:
+                    errors.append(
+                        f"Could not determine branch for project {project_id}")
+                    continue
+                projects.append((project_id, branch))
+
+            if noop:
+                # Dry runs only read the repository, so each project gets its own
+                # worktree and they run side by side.
+                args = build_version_args(
                     noop=noop,
-                    print_version=False,
-                    print_tag=False,
-                    print_last_released=False,
-                    print_last_released_tag=False,
                     major=major,
                     minor=minor,
                     patch=patch,
@@ -651,41 +1099,102 @@ def batch_version_worker(noop: bool,
                     commit=commit,
                     tag=tag,
                     changelog=changelog,
-                    push=push,
-                    vcs_release=True,
-                    as_prerelease=False,
-                    prerelease_token=None,
-                    build_metadata=None,
-                    skip_build=False
+                    push=push
                 )
-
-            except Exception:
-                errors.append(
-                    f"Error processing project {project_id}: {traceback.format_exc()}")
-
-        # Return to the original branch
-        repo.git.checkout(current_branch)
-
-        # Report any errors
-        if errors:
-            display_panel_message(
-                "Batch Version Warnings",
-                "\n".join(errors),
-                "yellow"
-            )
+                dry_run_errors, exit_code = _dry_run_batch(repo, projects, args)
+                errors.extend(dry_run_errors)
+            else:
+                current_branch = _current_branch(repo_root) or repo.active_branch.name
+
+                # Process projects branch by branch so each branch is checked out
+                # at most once, starting with the one that is already checked out
+                by_branch = {current_branch: []}
+                for project_id, branch in projects:
+                    by_branch.setdefault(branch, []).append(project_id)
+
+                # Every project reuses the same Repo; only the checkout changes
+                checked_out = current_branch
+                try:
+                    for branch, project_ids in by_branch.items():
+                        for project_id in project_ids:
+                            try:
+                                if branch != checked_out:
+                                    # Switch to the target branch
+                                    repo.git.checkout(branch)
+                                    checked_out = branch
+                                    get_git_info.cache_clear()
+
+                                display_panel_message(
+                                    "Batch Version",
+                                    f"Processing project [bold green]{project_id}[/bold green] on branch [bold blue]{branch}[/bold blue]",
+                                    "blue"
+                                )
+
+                                # Call version_worker function directly
+                                version_worker(
+                                    project_id=project_id,
+                                    noop=noop,
+                                    print_version=False,
+                                    print_tag=False,
+                                    print_last_released=False,
+                                    print_last_released_tag=False,
+                                    major=major,
+                                    minor=minor,
+                                    patch=patch,
+                                    prerelease=prerelease,
+                                    commit=commit,
+                                    tag=tag,
+                                    changelog=changelog,
+                                    push=push,
+                                    vcs_release=True,
+                                    as_prerelease=False,
+                                    prerelease_token=None,
+                                    build_metadata=None,
+                                    skip_build=False,
+                                    in_process=True,
+                                    _ctx=(repo, branch, repo_root)
+                                )
+
+                            except SystemExit as e:
+                                # A project that exits does not stop the rest of the batch
+                                code = e.code if isinstance(e.code, int) else 1
+                                if code:
+                                    exit_code = max(exit_code, code)
+                                    errors.append(
+                                        f"Project {project_id} exited with status {code}")
+                            except Exception:
+                                errors.append(
+                                    f"Error processing project {project_id}: {traceback.format_exc()}")
+                finally:
+                    # Return to the original branch
+                    if checked_out != current_branch:
+                        repo.git.checkout(current_branch)
+                        get_git_info.cache_clear()
+
+            # Report any errors
+            if errors:
+                display_panel_message(
+                    "Batch Version Warnings",
+                    "\n".join(errors),
+                    "yellow"
+                )
+            if exit_code:
+                sys.exit(exit_code)
 
     except Exception:
-        console.print_exception()
+        _console().print_exception()
         sys.exit(1)
 
 
 def init_worker(config: ProjectConfig, current_version: str, template_dir: str) -> None:
     try:
-        release_mate_dir = Path(config.repo_root) / '.release-mate'
+        release_mate_dir = _release_mate_dir(config.repo_root)
         release_mate_dir.mkdir(exist_ok=True)
 
         # Check for duplicate project config
         config_file = validate_config_file(config.project_id, config)
+        from cookiecutter.main import cookiecutter
+
         _ = cookiecutter(
             template_dir,
             no_input=True,
@@ -705,7 +1214,7 @@ def init_worker(config: ProjectConfig, current_version: str, template_dir: str)
         create_git_tag(f"{config.project_id}-{current_version}")
 
     except Exception:
-        console.print_exception()
+        _console().print_exception()
         sys.exit(1)
 
 
@@ -731,14 +1240,9 @@ def _execute_publish(config_file: Path, args: List[str], repo_path: str) -> None
     cmd = ["semantic-release", "-c",
            str(config_file)] + pre_command_args + ["publish"] + post_command_args
 
-    # Store current directory
-    current_dir = os.getcwd()
     try:
-        # Change to repo directory
-        os.chdir(repo_path)
-
         result = subprocess.run(
-            cmd, check=True, capture_output=True, text=True)
+            cmd, check=True, capture_output=True, text=True, cwd=repo_path)
         if result.stdout:
             display_panel_message(
                 "Publish Logs",
@@ -758,9 +1262,6 @@ def _execute_publish(config_file: Path, args: List[str], repo_path: str) -> None
             "red"
         )
         sys.exit(1)
-    finally:
-        # Always restore original directory
-        os.chdir(current_dir)
 
 
 def publish_worker(project_id: Optional[str] = None, noop: bool = False, tag: Optional[str] = None) -> None:
@@ -802,14 +1303,274 @@ def publish_worker(project_id: Optional[str] = None, noop: bool = False, tag: Op
         _execute_publish(config_file, args, repo_root)
 
     except Exception:
-        console.print_exception()
+        _console().print_exception()
         sys.exit(1)
 
 
-def install_shell_completion(command_name: str) -> None:
+def _file_contains(path: str, needle: bytes) -> bool:
+    """
+    Check whether a file contains a byte string without reading it into memory.
+
+    Args:
+        path (str): Path to the file
+        needle (bytes): Byte string to search for
+
+    Returns:
+        bool: True if the file exists and contains the byte string
+    """
+    try:
+        with open(path, 'rb') as f:
+            # mmap refuses zero-length files
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(needle) != -1
+    except FileNotFoundError:
+        return False
+
+
+@dataclasses.dataclass
+class CommandCompletion:
+    """Static description of a CLI command used to render completion scripts."""
+    name: str
+    help: str
+    options: List[str]
+    project_id_options: List[str] = dataclasses.field(default_factory=list)
+    project_id_argument: bool = False
+
+
+def _project_ids_command(command_name: str) -> str:
+    """Shell command that prints the project IDs of the current repository."""
+    return f'{command_name} __complete_project_ids 2>/dev/null'
+
+
+def _render_bash_completion(command_name: str, commands: List[CommandCompletion]) -> str:
+    """
+    Render a bash completion script with the command and option names inlined.
+
+    Only project IDs are looked up at completion time, through the hidden
+    ``__complete_project_ids`` command.
+
+    Args:
+        command_name (str): Name of the executable to complete
+        commands (List[CommandCompletion]): Commands to complete
+
+    Returns:
+        str: The completion script
+    """
+    func = '_' + re.sub(r'\W', '_', command_name) + '_completion'
+    project_ids = f'COMPREPLY=($(compgen -W "$({_project_ids_command(command_name)})" -- "$cur"))'
+    lines = [
+        f'# {command_name} completion, generated by `{command_name} install-completion`',
+        f'{func}() {{',
+        '    local cur="${COMP_WORDS[COMP_CWORD]}"',
+        '    local prev="${COMP_WORDS[COMP_CWORD-1]}"',
+        '    if [[ $COMP_CWORD -eq 1 ]]; then',
+        f'        COMPREPLY=($(compgen -W "{" ".join(c.name for c in commands)}" -- "$cur"))',
+        '        return',
+        '    fi',
+        '    case "${COMP_WORDS[1]}" in',
+    ]
+    for command in commands:
+        lines.append(f'        {command.name})')
+        if command.project_id_options:
+            lines += [
+                '            case "$prev" in',
+                f'                {"|".join(command.project_id_options)})',
+                f'                    {project_ids}',
+                '                    return',
+                '                    ;;',
+                '            esac',
+            ]
+        if command.project_id_argument:
+            lines += [
+                '            if [[ "$cur" != -* ]]; then',
+                f'                {project_ids}',
+                '                return',
+                '            fi',
+            ]
+        lines += [
+            f'            COMPREPLY=($(compgen -W "{" ".join(command.options)}" -- "$cur"))',
+            '            ;;',
+        ]
+    lines += [
+        '    esac',
+        '}',
+        f'complete -F {func} {command_name}',
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def _render_zsh_completion(command_name: str, commands: List[CommandCompletion]) -> str:
+    """
+    Render a zsh completion script by loading the bash one through bashcompinit.
+
+    Args:
+        command_name (str): Name of the executable to complete
+        commands (List[CommandCompletion]): Commands to complete
+
+    Returns:
+        str: The completion script
+    """
+    return ('autoload -U +X bashcompinit && bashcompinit\n'
+            + _render_bash_completion(command_name, commands))
+
+
+def _render_fish_completion(command_name: str, commands: List[CommandCompletion]) -> str:
+    """
+    Render a fish completion script with the command and option names inlined.
+
+    Args:
+        command_name (str): Name of the executable to complete
+        commands (List[CommandCompletion]): Commands to complete
+
+    Returns:
+        str: The completion script
+    """
+    def quote(text: str) -> str:
+        return "'" + text.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+    project_ids = quote(f'({_project_ids_command(command_name)})')
+    lines = [
+        f'# {command_name} completion, generated by `{command_name} install-completion`',
+        f'complete -c {command_name} -f',
+    ]
+    for command in commands:
+        lines.append(
+            f'complete -c {command_name} -n __fish_use_subcommand -a {command.name} -d {quote(command.help)}')
+        condition = quote(f'__fish_seen_subcommand_from {command.name}')
+        for option in command.options:
+            if option.startswith('--'):
+                flag = f'-l {option[2:]}'
+            elif len(option) == 2:
+                flag = f'-s {option[1:]}'
+            else:
+                flag = f'-o {option[1:]}'
+            if option in command.project_id_options:
+                flag += f' -x -a {project_ids}'
+            lines.append(f'complete -c {command_name} -n {condition} {flag}')
+        if command.project_id_argument:
+            lines.append(f'complete -c {command_name} -n {condition} -a {project_ids}')
+    return '\n'.join(lines) + '\n'
+
+
+# Shell name -> (rc file, rc line that loads a {script}, script renderer)
+_SHELL_TABLE = {
+    'bash': ('~/.bashrc', '[ -f "{script}" ] && . "{script}"', _render_bash_completion),
+    'zsh': ('~/.zshrc', '[ -f "{script}" ] && . "{script}"', _render_zsh_completion),
+    'fish': ('~/.config/fish/config.fish', 'test -f "{script}"; and source "{script}"', _render_fish_completion),
+}
+
+
+def _completion_script_file(command_name: str, shell_name: str) -> str:
+    """
+    Get the path the generated completion script is written to.
+
+    Args:
+        command_name (str): Name of the executable to complete
+        shell_name (str): Name of the shell the script is for
+
+    Returns:
+        str: Path under $XDG_DATA_HOME (or ~/.local/share)
+    """
+    data_home = os.environ.get('XDG_DATA_HOME') or os.path.join(
+        os.path.expanduser('~'), '.local', 'share')
+    return os.path.join(data_home, command_name, f'completion.{shell_name}')
+
+
+def _legacy_completion_env_var(command_name: str) -> str:
+    """
+    Get the environment variable earlier releases used to load completion.
+
+    Args:
+        command_name (str): Name of the executable to complete
+
+    Returns:
+        str: Variable name in Click's ``_<COMMAND>_COMPLETE`` form
+    """
+    return f"_{command_name.replace('-', '_').upper()}_COMPLETE"
+
+
+def _legacy_completion_snippets(command_name: str) -> List[str]:
+    """
+    Get the rc file snippets earlier releases wrote to load completion.
+
+    Args:
+        command_name (str): Name of the executable to complete
+
+    Returns:
+        List[str]: The bash, zsh and fish snippets, exactly as they were written
+    """
+    env_var = _legacy_completion_env_var(command_name)
+    return [
+        f'if command -v {command_name} > /dev/null; then\n'
+        f'  eval "$({env_var}=bash_source {command_name} 2>/dev/null || true)"\n'
+        f'fi',
+        f'if (( $+commands[{command_name}] )); then\n'
+        f'  eval "$({env_var}=zsh_source {command_name} 2>/dev/null || true)"\n'
+        f'fi',
+        f'if type -q {command_name}\n'
+        f'  eval (env {env_var}=fish_source {command_name} 2>/dev/null; or true)\n'
+        f'end',
+    ]
+
+
+def _replace_legacy_completion(rc_file: str, command_name: str, completion_command: str) -> bool:
+    """
+    Replace the eval-based completion setup of earlier releases in an rc file.
+
+    Only the exact snippets earlier releases wrote are touched: the first one
+    found is replaced by the line loading the generated script and any others
+    are removed, so completion is not registered twice. The file is rewritten
+    atomically.
+
+    Args:
+        rc_file (str): Path to the rc file
+        command_name (str): Name of the executable to complete
+        completion_command (str): Line that loads the generated script
+
+    Returns:
+        bool: True if a legacy snippet was found and replaced
+    """
+    snippets = _legacy_completion_snippets(command_name)
+    if not any(_file_contains(rc_file, snippet.encode()) for snippet in snippets):
+        return False
+
+    with open(rc_file) as f:
+        content = f.read()
+
+    for snippet in snippets:
+        if snippet not in content:
+            continue
+        if completion_command in content:
+            content = content.replace(snippet, '')
+        else:
+            content = content.replace(snippet, completion_command, 1).replace(snippet, '')
+
+    # Write to a temporary file first so an interrupted write never leaves
+    # a truncated rc file behind
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(rc_file), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        shutil.copymode(rc_file, tmp_path)
+        os.replace(tmp_path, rc_file)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    return True
+
+
+def install_shell_completion(command_name: str, commands: List[CommandCompletion]) -> None:
     """
     Install shell completion for the current shell.
-    Automatically detects shell type and updates appropriate rc file.
+    Automatically detects shell type, writes a static completion script and
+    makes the appropriate rc file load it.
+
+    Args:
+        command_name (str): Name of the executable to complete
+        commands (List[CommandCompletion]): Commands to complete
     """
     shell = os.environ.get('SHELL', '')
     if not shell:
@@ -821,60 +1582,61 @@ def install_shell_completion(command_name: str) -> None:
         sys.exit(1)
 
     shell_name = os.path.basename(shell)
-    rc_file = None
-    completion_command = None
-
-    if shell_name == 'bash':
-        rc_file = os.path.expanduser('~/.bashrc')
-        completion_command = (
-            f'if command -v {command_name} > /dev/null; then\n'
-            f'  eval "$(_RELEASE_MATE_COMPLETE=bash_source {command_name} 2>/dev/null || true)"\n'
-            f'fi'
-        )
-    elif shell_name == 'zsh':
-        rc_file = os.path.expanduser('~/.zshrc')
-        completion_command = (
-            f'if (( $+commands[{command_name}] )); then\n'
-            f'  eval "$(_RELEASE_MATE_COMPLETE=zsh_source {command_name} 2>/dev/null || true)"\n'
-            f'fi'
-        )
-    elif shell_name == 'fish':
-        rc_file = os.path.expanduser('~/.config/fish/config.fish')
-        completion_command = (
-            f'if type -q {command_name}\n'
-            f'  eval (env _RELEASE_MATE_COMPLETE=fish_source {command_name} 2>/dev/null; or true)\n'
-            f'end'
-        )
-    else:
+    entry = _SHELL_TABLE.get(shell_name)
+    if entry is None:
         display_panel_message(
             "Error",
-            f"Unsupported shell: {shell_name}. Supported shells: bash, zsh, fish",
+            f"Unsupported shell: {shell_name}. Supported shells: {', '.join(_SHELL_TABLE)}",
             "red"
         )
         sys.exit(1)
 
+    rc_template, source_template, render = entry
+    rc_file = os.path.expanduser(rc_template)
+    script_file = _completion_script_file(command_name, shell_name)
+    completion_command = source_template.format(script=script_file)
+
+    # (Re)generate the script so it always matches the installed commands
+    os.makedirs(os.path.dirname(script_file), exist_ok=True)
+    with open(script_file, 'w') as f:
+        f.write(render(command_name, commands))
+
     # Create parent directories if they don't exist
     os.makedirs(os.path.dirname(rc_file), exist_ok=True)
 
+    # Upgrade the eval-based setup of earlier releases in place
+    replaced = _replace_legacy_completion(rc_file, command_name, completion_command)
+
+    # A setup the user edited by hand is left alone for them to remove
+    env_var = _legacy_completion_env_var(command_name)
+    if _file_contains(rc_file, f'{env_var}='.encode()):
+        display_panel_message(
+            "Warning",
+            f"{rc_file} still loads completion through {env_var}.\n" +
+            "Please remove that setup so completion is not registered twice.",
+            "yellow"
+        )
+
     # Check if completion is already installed
-    if os.path.exists(rc_file):
-        with open(rc_file, 'r') as f:
-            if completion_command in f.read():
-                display_panel_message(
-                    "Info",
-                    "Shell completion is already installed.",
-                    "blue"
-                )
-                return
+    if not replaced and _file_contains(rc_file, completion_command.encode()):
+        display_panel_message(
+            "Info",
+            f"Shell completion is already installed. Regenerated {script_file}.",
+            "blue"
+        )
+        return
 
-    # Append completion command to rc file
-    with open(rc_file, 'a') as f:
-        f.write(f'\n# Release Mate completion\n{completion_command}\n')
+    if not replaced:
+        # Append completion command to rc file
+        with open(rc_file, 'a') as f:
+            f.write(f'\n# Release Mate completion\n{completion_command}\n')
 
     display_panel_message(
         "Success",
         "✨ Shell completion installed successfully!\n\n" +
-        f"The completion script has been added to: {rc_file}\n\n" +
+        f"The completion script has been written to: {script_file}\n" +
+        f"and is loaded from: {rc_file}\n\n" +
+        ("The previous completion setup in the rc file has been replaced.\n\n" if replaced else "") +
         "To start using completions, either:\n" +
         "1. Restart your shell\n" +
         f"2. Or run: source {rc_file}",
@@ -0,0 +1,29 @@
+"""Subcommands of the release-mate CLI, one module per command.
+
+Each module exposes its click command as ``command`` and is only imported
+when that command is invoked, listed in help, or completed.
+"""
+import click
+
+
+def project_id_completion(ctx, param, incomplete):
+    """Shell completion for project IDs, importing the API only when asked."""
+    from .. import api
+
+    return api.project_id_completion(ctx, param, incomplete)
+
+
+class ProjectIdParam:
+    """Marks a parameter that takes an existing project ID and completes it."""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('shell_complete', project_id_completion)
+        super().__init__(*args, **kwargs)
+
+
+class ProjectIdOption(ProjectIdParam, click.Option):
+    """Option that takes an existing project ID."""
+
+
+class ProjectIdArgument(ProjectIdParam, click.Argument):
+    """Argument that takes an existing project ID."""
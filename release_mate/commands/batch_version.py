@@ -0,0 +1,30 @@
+"""The ``batch-version`` command."""
+import click
+
+
+@click.command("batch-version")
+@click.option('--noop', is_flag=True, help='Dry run without making any changes')
+@click.option('--major', is_flag=True, help='Force the next version to be a major release')
+@click.option('--minor', is_flag=True, help='Force the next version to be a minor release')
+@click.option('--patch', is_flag=True, help='Force the next version to be a patch release')
+@click.option('--prerelease', is_flag=True, help='Force the next version to be a prerelease')
+@click.option('--commit/--no-commit', default=True, help='Whether or not to commit changes locally')
+@click.option('--tag/--no-tag', default=True, help='Whether or not to create a tag for the new version')
+@click.option('--changelog/--no-changelog', default=True, help='Whether or not to update the changelog')
+@click.option('--push/--no-push', default=True, help='Whether or not to push the new commit and tag to the remote')
+def command(
+    noop: bool,
+    major: bool,
+    minor: bool,
+    patch: bool,
+    prerelease: bool,
+    commit: bool,
+    tag: bool,
+    changelog: bool,
+    push: bool
+):
+    """Perform version bumps for all projects in the repository."""
+    from .. import api
+
+    api.batch_version_worker(noop, major, minor, patch,
+                             prerelease, commit, tag, changelog, push)
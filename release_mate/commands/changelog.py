@@ -0,0 +1,21 @@
+"""The ``changelog`` command."""
+from typing import Optional
+
+import click
+
+from . import ProjectIdArgument
+
+
+@click.command("changelog")
+@click.argument('project-id', cls=ProjectIdArgument, required=False)
+@click.option('--post-to-release-tag', help='Post the generated release notes to the remote VCS\'s release for this tag')
+@click.option('--noop', is_flag=True, help='Dry run without making any changes')
+def command(
+    project_id: str,
+    post_to_release_tag: Optional[str],
+    noop: bool,
+):
+    """Generate and optionally publish a changelog for your project."""
+    from .. import api
+
+    api.changelog_worker(project_id, post_to_release_tag, noop)
@@ -0,0 +1,12 @@
+"""The hidden ``__complete_project_ids`` command used by completion scripts."""
+import click
+
+
+@click.command("__complete_project_ids", hidden=True)
+@click.argument('incomplete', required=False, default='')
+def command(incomplete: str):
+    """Print the project IDs of the current repository, one per line."""
+    from .. import api
+
+    for project_id in api.project_id_completion(None, None, incomplete):
+        click.echo(project_id)
@@ -0,0 +1,23 @@
+"""The ``init`` command."""
+from importlib.resources import as_file, files
+
+import click
+
+
+@click.command("init")
+@click.option('--id', '-i', 'project_id', required=False, help='Project identifier')
+@click.option('--current-version', '-v0', required=False, default='0.0.0', help='Initial version')
+@click.option('--dir', '-d', 'project_dir', default='.', help='Project directory')
+def command(
+    project_id: str,
+    current_version: str,
+    project_dir: str,
+):
+    """Initialize a new release-mate project."""
+    from .. import api
+
+    config = api.get_project_config(project_id, project_dir)
+    # cookiecutter needs a real directory, which as_file guarantees even for
+    # zipped installs
+    with as_file(files("release_mate").joinpath('templates/project')) as template_dir:
+        api.init_worker(config, current_version, template_dir=str(template_dir))
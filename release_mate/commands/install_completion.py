@@ -0,0 +1,46 @@
+"""The ``install-completion`` command."""
+import click
+
+from . import ProjectIdParam
+
+
+def _completion_commands(ctx: click.Context):
+    """
+    Describe the visible subcommands of the root group for completion scripts.
+
+    Args:
+        ctx (click.Context): Context of the running command
+
+    Returns:
+        List[CommandCompletion]: One entry per visible subcommand
+    """
+    from .. import api
+
+    group = ctx.find_root().command
+    commands = []
+    for name in group.list_commands(ctx):
+        command = group.get_command(ctx, name)
+        if command is None or command.hidden:
+            continue
+        completion = api.CommandCompletion(
+            name=name, help=command.get_short_help_str(), options=[])
+        for param in command.params:
+            completes_project_ids = isinstance(param, ProjectIdParam)
+            if isinstance(param, click.Option):
+                completion.options += param.opts + param.secondary_opts
+                if completes_project_ids:
+                    completion.project_id_options = list(param.opts)
+            elif completes_project_ids:
+                completion.project_id_argument = True
+        completion.options.append('--help')
+        commands.append(completion)
+    return commands
+
+
+@click.command("install-completion", help="install shell completion for bash, zsh or fish shells")
+@click.pass_context
+def command(ctx: click.Context):
+    """Install shell completion for bash, zsh, or fish shells."""
+    from .. import api
+
+    api.install_shell_completion('release-mate', _completion_commands(ctx))
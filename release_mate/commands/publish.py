@@ -0,0 +1,17 @@
+"""The ``publish`` command."""
+from typing import Optional
+
+import click
+
+from . import ProjectIdOption
+
+
+@click.command("publish")
+@click.option('--id', '-i', 'project_id', cls=ProjectIdOption, required=False, help='Project identifier')
+@click.option('--noop', is_flag=True, help='Dry run without making changes')
+@click.option('--tag', help='The tag associated with the release to publish to')
+def command(project_id: str, noop: bool, tag: Optional[str]):
+    """Build and publish a distribution to a VCS release."""
+    from .. import api
+
+    api.publish_worker(project_id, noop, tag)
@@ -0,0 +1,74 @@
+"""The ``version`` command."""
+from typing import Optional
+
+import click
+
+from . import ProjectIdOption
+
+
+@click.command("version")
+@click.option('--id', '-i', 'project_id', cls=ProjectIdOption, required=False, help='Project identifier')
+@click.option('--noop', is_flag=True, help='Dry run without making any changes')
+@click.option('--print', 'print_version', is_flag=True, help='Print the next version and exit')
+@click.option('--print-tag', is_flag=True, help='Print the next version tag and exit')
+@click.option('--print-last-released', is_flag=True, help='Print the last released version and exit')
+@click.option('--print-last-released-tag', is_flag=True, help='Print the last released version tag and exit')
+@click.option('--major', is_flag=True, help='Force the next version to be a major release')
+@click.option('--minor', is_flag=True, help='Force the next version to be a minor release')
+@click.option('--patch', is_flag=True, help='Force the next version to be a patch release')
+@click.option('--prerelease', is_flag=True, help='Force the next version to be a prerelease')
+@click.option('--commit/--no-commit', default=True, help='Whether or not to commit changes locally')
+@click.option('--tag/--no-tag', default=True, help='Whether or not to create a tag for the new version')
+@click.option('--changelog/--no-changelog', default=True, help='Whether or not to update the changelog')
+@click.option('--push/--no-push', default=True, help='Whether or not to push the new commit and tag to the remote')
+@click.option('--vcs-release/--no-vcs-release', default=True,
+              help='Whether or not to create a release in the remote VCS, if supported')
+@click.option('--as-prerelease', is_flag=True, help='Ensure the next version to be released is a prerelease version')
+@click.option('--prerelease-token', help='Force the next version to use this prerelease token, if it is a prerelease')
+@click.option('--build-metadata', help='Build metadata to append to the new version')
+@click.option('--skip-build', is_flag=True, help='Skip building the current project')
+def command(
+    project_id: Optional[str],
+    noop: bool,
+    print_version: bool,
+    print_tag: bool,
+    print_last_released: bool,
+    print_last_released_tag: bool,
+    major: bool,
+    minor: bool,
+    patch: bool,
+    prerelease: bool,
+    commit: bool,
+    tag: bool,
+    changelog: bool,
+    push: bool,
+    vcs_release: bool,
+    as_prerelease: bool,
+    prerelease_token: Optional[str],
+    build_metadata: Optional[str],
+    skip_build: bool
+):
+    """Perform a version bump using semantic-release."""
+    from .. import api
+
+    api.version_worker(
+        project_id=project_id,
+        noop=noop,
+        print_version=print_version,
+        print_tag=print_tag,
+        print_last_released=print_last_released,
+        print_last_released_tag=print_last_released_tag,
+        major=major,
+        minor=minor,
+        patch=patch,
+        prerelease=prerelease,
+        commit=commit,
+        tag=tag,
+        changelog=changelog,
+        push=push,
+        vcs_release=vcs_release,
+        as_prerelease=as_prerelease,
+        prerelease_token=prerelease_token,
+        build_metadata=build_metadata,
+        skip_build=skip_build
+    )
@@ -0,0 +1,329 @@
+"""Opt-in warm-interpreter daemon behind the ``release-mate-fast`` entry point.
+
+With ``RELEASE_MATE_DAEMON=1`` the first invocation starts a background
+server that keeps release-mate and its dependencies imported. Later
+invocations connect to it over a Unix socket and hand over their arguments,
+environment, working directory and stdio file descriptors. The server forks
+a child per request, so every command still runs in a fresh process state
+and only the import cost is shared.
+
+Without the environment variable, where file descriptors cannot be passed
+over sockets, or when the socket or the server listening on it is not owned
+by the current user, ``release-mate-fast`` behaves exactly like ``release-mate``.
+"""
+import contextlib
+import json
+import os
+import signal
+import socket
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Optional, Tuple
+
+from . import __version__
+
+# Seconds the server waits for a request before shutting itself down
+IDLE_TIMEOUT = 600
+
+# Seconds a client waits for a freshly started server to accept connections
+STARTUP_TIMEOUT = 5.0
+
+# Seconds the server waits for a connected client to send its request.
+# Requests are read one at a time, so a silent client must not hold up the rest.
+REQUEST_TIMEOUT = 5.0
+
+_HEADER = struct.Struct('!I')
+_EXIT_CODE = struct.Struct('!i')
+# struct ucred: pid, uid, gid
+_PEERCRED = struct.Struct('3i')
+
+
+def daemon_enabled() -> bool:
+    """
+    Check whether daemon mode was requested and is supported here.
+
+    Returns:
+        bool: True if RELEASE_MATE_DAEMON=1 and the platform can pass file descriptors
+    """
+    return os.environ.get('RELEASE_MATE_DAEMON') == '1' and hasattr(socket, 'send_fds')
+
+
+def _is_private_dir(path: str) -> bool:
+    """Check that a directory belongs to the current user and nobody else can access it."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid() and not st.st_mode & 0o077
+
+
+def socket_path() -> Optional[str]:
+    """
+    Get the path of the daemon socket for this user and release-mate version.
+
+    The version is part of the name so that an upgrade never talks to a
+    server still running the old code. Without $XDG_RUNTIME_DIR the socket
+    lives in a per-user 0700 directory under the temporary directory, so
+    other users can neither plant a socket there nor connect to ours.
+
+    Returns:
+        Optional[str]: Path of the socket, or None if no private directory is available
+    """
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if not runtime_dir:
+        runtime_dir = os.path.join(tempfile.gettempdir(), f'release-mate-{os.getuid()}')
+        try:
+            os.mkdir(runtime_dir, 0o700)
+        except FileExistsError:
+            pass
+        except OSError:
+            return None
+    if not _is_private_dir(runtime_dir):
+        return None
+    return os.path.join(runtime_dir, f'release-mate-{__version__}-{os.getuid()}.sock')
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    """Read exactly ``size`` bytes from a stream socket."""
+    data = b''
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("daemon connection closed")
+        data += chunk
+    return data
+
+
+def send_request(sock: socket.socket, argv: List[str], fds: List[int]) -> None:
+    """
+    Send a command invocation, together with its stdio descriptors, to the server.
+
+    Args:
+        sock (socket.socket): Connected Unix stream socket
+        argv (List[str]): Command line arguments, without the program name
+        fds (List[int]): The stdin, stdout and stderr file descriptors to hand over
+    """
+    payload = json.dumps({
+        'argv': argv,
+        'cwd': os.getcwd(),
+        'env': dict(os.environ),
+    }).encode()
+    # The descriptors travel with the header; the payload follows on the stream
+    socket.send_fds(sock, [_HEADER.pack(len(payload))], fds)
+    sock.sendall(payload)
+
+
+def recv_request(sock: socket.socket) -> Tuple[dict, List[int]]:
+    """
+    Receive a command invocation sent by :func:`send_request`.
+
+    Args:
+        sock (socket.socket): Connected Unix stream socket
+
+    Returns:
+        tuple[dict, List[int]]: The request (argv, cwd, env) and the received descriptors
+    """
+    header, fds, _, _ = socket.recv_fds(sock, _HEADER.size, 3)
+    if len(header) < _HEADER.size:
+        header += _recv_exactly(sock, _HEADER.size - len(header))
+    (size,) = _HEADER.unpack(header)
+    return json.loads(_recv_exactly(sock, size)), fds
+
+
+def _run_request(conn: socket.socket, request: dict, fds: List[int]) -> None:
+    """
+    Run one command in a forked child and report its exit code. Never returns.
+
+    Args:
+        conn (socket.socket): Connection the request arrived on
+        request (dict): The decoded request
+        fds (List[int]): The client's stdin, stdout and stderr
+    """
+    # The server ignores SIGCHLD; restore the default so that waiting on
+    # subprocesses (semantic-release, git) reports their real exit status
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+
+    exit_code = 1
+    try:
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        os.chdir(request['cwd'])
+        os.environ.clear()
+        os.environ.update(request['env'])
+
+        from .cli import cli
+
+        try:
+            cli.main(args=request['argv'], prog_name='release-mate')
+            exit_code = 0
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except BaseException:
+        import traceback
+
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            conn.sendall(_EXIT_CODE.pack(exit_code))
+        finally:
+            os._exit(exit_code)
+
+
+def serve(path: str) -> None:
+    """
+    Run the daemon: preload dependencies, then fork a child per request.
+
+    Args:
+        path (str): Path of the Unix socket to listen on
+    """
+    # Pay the import cost once; forked children inherit the loaded modules
+    import click  # noqa: F401
+    import git  # noqa: F401
+    import rich.console  # noqa: F401
+    import rich.panel  # noqa: F401
+
+    from . import api  # noqa: F401
+    from .cli import cli  # noqa: F401
+
+    # Children are never waited on explicitly
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    os.chmod(path, 0o600)
+    server.listen()
+    server.settimeout(IDLE_TIMEOUT)
+
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                return
+            with conn:
+                conn.settimeout(REQUEST_TIMEOUT)
+                try:
+                    request, fds = recv_request(conn)
+                except (OSError, ValueError):
+                    # Includes a client that timed out; drop the connection
+                    continue
+                conn.settimeout(None)
+                if os.fork() == 0:
+                    server.close()
+                    _run_request(conn, request, fds)
+                for fd in fds:
+                    os.close(fd)
+    finally:
+        server.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+
+
+def _peer_is_current_user(sock: socket.socket) -> bool:
+    """Check the credentials of the process on the other end of a Unix socket, where the platform reports them."""
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return True
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _PEERCRED.size)
+    _, uid, _ = _PEERCRED.unpack(creds)
+    return uid == os.getuid()
+
+
+def _connect(path: str) -> Optional[socket.socket]:
+    """
+    Connect to the daemon socket.
+
+    The request carries the whole environment, tokens included, and the
+    caller's stdio, so only a socket and a server owned by the current user
+    are accepted.
+
+    Args:
+        path (str): Path of the daemon socket
+
+    Returns:
+        Optional[socket.socket]: The connection, or None if nothing trustworthy is listening
+    """
+    try:
+        if os.lstat(path).st_uid != os.getuid():
+            return None
+    except OSError:
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+        if not _peer_is_current_user(sock):
+            sock.close()
+            return None
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _start_server(path: str) -> Optional[socket.socket]:
+    """
+    Start a detached daemon and wait until it accepts connections.
+
+    Args:
+        path (str): Path of the Unix socket the daemon should listen on
+
+    Returns:
+        Optional[socket.socket]: A connection to the new daemon, or None if it did not come up
+    """
+    subprocess.Popen(
+        [sys.executable, '-m', 'release_mate.daemon', path],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        sock = _connect(path)
+        if sock is not None:
+            return sock
+        time.sleep(0.05)
+    return None
+
+
+def main() -> None:
+    """Entry point of ``release-mate-fast``."""
+    if not daemon_enabled():
+        from .cli import cli
+
+        cli(prog_name='release-mate')
+        return
+
+    path = socket_path()
+    sock = None
+    if path is not None:
+        sock = _connect(path) or _start_server(path)
+    if sock is None:
+        # The daemon could not be reached safely; run in this process instead
+        from .cli import cli
+
+        cli(prog_name='release-mate')
+        return
+
+    try:
+        with sock:
+            send_request(sock, sys.argv[1:], [0, 1, 2])
+            exit_code, = _EXIT_CODE.unpack(_recv_exactly(sock, _EXIT_CODE.size))
+    except ConnectionError:
+        # The server or the child running the command died mid-request
+        print("release-mate-fast: lost the connection to the daemon before the command finished",
+              file=sys.stderr)
+        sys.exit(1)
+    sys.exit(exit_code)
+
+
+if __name__ == '__main__':
+    serve(sys.argv[1])
@@ -0,0 +1,200 @@
+"""Shared pytest fixtures."""
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import git
+import pytest
+from click.testing import CliRunner
+
+from release_mate import api
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """Create a CLI runner for testing click commands."""
+    return CliRunner()
+
+
+class FakeRepo:
+    """Plain-attribute stand-in for ``git.Repo`` in tests that never inspect calls on the repository."""
+
+    def __init__(self, working_tree_dir="/mock/repo/path", remote_url="https://github.com/user/repo.git"):
+        self.active_branch = SimpleNamespace(name="main")
+        self.working_tree_dir = working_tree_dir
+        self.git = SimpleNamespace(checkout=MagicMock(), tag=MagicMock(), worktree=MagicMock())
+        self._remote = SimpleNamespace(urls=[remote_url])
+
+    def remote(self, name="origin"):
+        return self._remote
+
+
+@pytest.fixture
+def fake_repo():
+    """Create a lightweight fake git repository."""
+    return FakeRepo()
+
+
+@pytest.fixture(scope="module")
+def mock_repo():
+    """Create a mock git repository."""
+    mock = MagicMock(spec=git.Repo)
+    mock.active_branch = SimpleNamespace(name="main")
+    # Repo only sets ``git`` in __init__, and its commands resolve through
+    # Git.__getattr__, so it cannot be spec'd
+    mock.git = MagicMock()
+    mock.remote.return_value.urls = ["https://github.com/user/repo.git"]
+    mock.working_tree_dir = "/mock/repo/path"
+    return mock
+
+
+@pytest.fixture(scope="session")
+def mock_config_path():
+    """Path of the "test" project config inside the mock repository."""
+    return Path("/mock/repo/path/.release-mate/test.toml")
+
+
+def _stub_api(monkeypatch, **attributes):
+    """Replace ``release_mate.api`` attributes with MagicMocks, keyed by short names."""
+    stubs = SimpleNamespace(**{key: MagicMock() for key in attributes})
+    for key, attribute in attributes.items():
+        monkeypatch.setattr(api, attribute, getattr(stubs, key))
+    return stubs
+
+
+@pytest.fixture
+def patched_api(mock_repo, monkeypatch):
+    """
+    Stub the repository lookup, project config lookup and version worker.
+
+    The repository lookup returns ``mock_repo``.
+
+    Returns:
+        SimpleNamespace: The stubs as ``validate``, ``get_config`` and ``worker``
+    """
+    stubs = _stub_api(monkeypatch,
+                      validate="validate_git_repository",
+                      get_config="get_project_config_file",
+                      worker="version_worker")
+    stubs.validate.return_value = mock_repo
+    return stubs
+
+
+@pytest.fixture(scope="module")
+def empty_toml(tmp_path_factory):
+    """Create an empty, read-only project config file once per module."""
+    config = tmp_path_factory.mktemp("config") / "test.toml"
+    config.touch()
+    return config
+
+
+@pytest.fixture
+def patched_version_deps(fake_repo, empty_toml, monkeypatch):
+    """
+    Stub what ``version_worker`` calls out to, so the real worker runs without git or semantic-release.
+
+    The repository lookup returns ``fake_repo`` and the project config lookup returns ``empty_toml``.
+
+    Returns:
+        SimpleNamespace: The stubs as ``validate``, ``get_config`` and ``run``, plus the ``config`` path
+    """
+    stubs = _stub_api(monkeypatch,
+                      validate="validate_git_repository",
+                      get_config="get_project_config_file",
+                      run="run_semantic_release")
+    stubs.validate.return_value = fake_repo
+    stubs.get_config.return_value = empty_toml
+    stubs.config = empty_toml
+    return stubs
+
+
+@pytest.fixture
+def api_stubs(monkeypatch):
+    """
+    Stub the repository, project discovery and semantic-release helpers used by the batch and changelog workers.
+
+    The repository lookup returns a mock on branch ``main`` whose root is ``/path/to/repo``.
+
+    Returns:
+        SimpleNamespace: The stubs as ``validate``, ``git_info``, ``configs``, ``identify``,
+        ``get_config``, ``run`` and ``changelog``
+    """
+    stubs = _stub_api(monkeypatch,
+                      validate="validate_git_repository",
+                      git_info="get_git_info",
+                      configs="_iter_project_configs",
+                      identify="identify_branch",
+                      get_config="get_project_config_file",
+                      run="run_semantic_release",
+                      changelog="run_semantic_release_changelog")
+    stubs.validate.return_value.active_branch.name = "main"
+    stubs.git_info.return_value = ("main", "", "", "/path/to/repo")
+    return stubs
+
+
+@pytest.fixture
+def fake_cwd(tmp_path, monkeypatch):
+    """Make ``tmp_path`` the reported working directory and report every path as existing."""
+    monkeypatch.setattr(os, "getcwd", lambda: str(tmp_path))
+    monkeypatch.setattr(os.path, "exists", lambda path: True)
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def multi_branch_config(tmp_path_factory):
+    """Write a read-only project configuration with two branch sections, once per session."""
+    config_file = tmp_path_factory.mktemp("tomls") / "test.toml"
+    config_file.write_text("""
+[tool.semantic_release.branches.main]
+match = "main"
+prerelease = false
+
+[tool.semantic_release.branches.develop]
+match = "develop"
+prerelease = true
+""")
+    return config_file
+
+
+@pytest.fixture(scope="module")
+def stub_subprocess():
+    """Replace ``subprocess.run`` for a whole module with a mock of a silent, successful run."""
+    with patch("subprocess.run") as mock_run:
+        yield mock_run
+
+
+@pytest.fixture(autouse=True)
+def reset_module_mocks(request):
+    """Reset module-scoped mocks so calls and side effects do not leak between tests."""
+    if "mock_repo" in request.fixturenames:
+        mock_repo = request.getfixturevalue("mock_repo")
+        mock_repo.reset_mock(return_value=False, side_effect=True)
+        mock_repo.remote.side_effect = None
+        mock_repo.remote.return_value.urls = ["https://github.com/user/repo.git"]
+    if "stub_subprocess" in request.fixturenames:
+        stub_subprocess = request.getfixturevalue("stub_subprocess")
+        stub_subprocess.reset_mock(return_value=True, side_effect=True)
+        stub_subprocess.return_value = MagicMock(stdout="", stderr="", returncode=0)
+
+
+@pytest.fixture(autouse=True)
+def clear_api_caches():
+    """Reset memoized git lookups so patched repositories are picked up."""
+    api._find_repo_root.cache_clear()
+    api._discover_repo.cache_clear()
+    api.get_git_info.cache_clear()
+    api._identify_branch_cached.cache_clear()
+    yield
+    api._find_repo_root.cache_clear()
+    api._discover_repo.cache_clear()
+    api.get_git_info.cache_clear()
+    api._identify_branch_cached.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_home(tmp_path, monkeypatch):
+    """Keep the completion cache out of the user's real cache directory."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
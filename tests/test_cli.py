@@ -1,36 +1,38 @@
 """Tests for the release-mate CLI functionality."""
+import os
 import subprocess
+import sys
 from pathlib import Path
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import MagicMock, patch
 
 import git
 import pytest
-from click.testing import CliRunner
 
-from release_mate.api import (build_version_args, create_git_tag,
-                              display_panel_message, get_available_project_ids,
-                              get_git_info, get_normalized_project_dir,
-                              identify_branch, run_semantic_release,
+import release_mate
+from release_mate import api
+from release_mate.api import (_cached_project_ids, _current_branch,
+                              _find_repo_root, _remote_url,
+                              _iter_project_configs,
+                              _run_semantic_release_in_process,
+                              batch_panels, build_version_args, create_git_tag,
+                              display_panel_message, get_git_info,
+                              get_normalized_project_dir,
+                              identify_branch, project_id_completion,
+                              run_semantic_release,
                               run_semantic_release_changelog,
                               validate_git_repository, version_worker)
 from release_mate.cli import cli
 
 
-@pytest.fixture
-def cli_runner():
-    """Create a CLI runner for testing click commands."""
-    return CliRunner()
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_repo():
     """Create a mock git repository."""
     mock = MagicMock(spec=git.Repo)
     mock.active_branch.name = "main"
     mock_remote = MagicMock()
-    mock_remote.urls = iter(["https://github.com/user/repo.git"])
+    mock_remote.urls = ["https://github.com/user/repo.git"]
     mock.remote.return_value = mock_remote
-    mock.git.rev_parse.return_value = "/path/to/repo"
+    mock.working_tree_dir = "/path/to/repo"
     return mock
 
 
@@ -40,9 +42,9 @@ def mock_repo_ssh():
     mock = MagicMock(spec=git.Repo)
     mock.active_branch.name = "main"
     mock_remote = MagicMock()
-    mock_remote.urls = iter(["git@github.com:user/repo.git"])
+    mock_remote.urls = ["git@github.com:user/repo.git"]
     mock.remote.return_value = mock_remote
-    mock.git.rev_parse.return_value = "/path/to/repo"
+    mock.working_tree_dir = "/path/to/repo"
     return mock
 
 
@@ -62,6 +64,20 @@ def test_validate_git_repository_failure():
     assert exc_info.value.code == 1
 
 
+def test_validate_git_repository_cached(mock_repo):
+    """Test repository discovery runs once per working directory."""
+    with patch("git.Repo") as mock_git_repo:
+        mock_git_repo.return_value = mock_repo
+        assert validate_git_repository() is validate_git_repository()
+        mock_git_repo.assert_called_once()
+
+
+def test_get_git_info_cached(mock_repo):
+    """Test git information is computed once per repository."""
+    assert get_git_info(mock_repo) == get_git_info(mock_repo)
+    mock_repo.remote.assert_called_once_with()
+
+
 def test_get_git_info(mock_repo):
     """Test getting git repository information."""
     branch_name, remote_url, domain, repo_root = get_git_info(mock_repo)
@@ -85,9 +101,9 @@ def test_get_git_info_no_remote():
     mock = MagicMock(spec=git.Repo)
     mock.active_branch.name = "main"
     mock_remote = MagicMock()
-    mock_remote.urls = iter([])  # Empty iterator to simulate no remote
+    mock_remote.urls = []  # No URLs to simulate no remote
     mock.remote.return_value = mock_remote
-    mock.git.rev_parse.return_value = "/path/to/repo"
+    mock.working_tree_dir = "/path/to/repo"
 
     branch_name, remote_url, domain, repo_root = get_git_info(mock)
     assert branch_name == "main"
@@ -96,32 +112,28 @@ def test_get_git_info_no_remote():
     assert repo_root == "/path/to/repo"
 
 
-@patch("os.path.exists", return_value=True)
-@patch("pathlib.Path.absolute")
-def test_get_normalized_project_dir(mock_absolute, mock_exists):
+def test_get_normalized_project_dir(fake_cwd):
     """Test normalizing project directory paths."""
-    repo_root = "/path/to/repo"
-    mock_absolute.return_value.as_posix.return_value = "/path/to/repo/project"
+    repo_root = str(fake_cwd.parent)
 
     # Test with current directory
     result = get_normalized_project_dir(".", repo_root)
-    assert result == "project"
+    assert result == fake_cwd.name
 
     # Test with absolute path
-    result = get_normalized_project_dir("/path/to/repo/project", repo_root)
-    assert result == "/path/to/repo/project"
+    result = get_normalized_project_dir(str(fake_cwd), repo_root)
+    assert result == str(fake_cwd)
 
     # Test with relative path
-    result = get_normalized_project_dir("project", repo_root)
-    assert result == "project"
+    result = get_normalized_project_dir(fake_cwd.name, repo_root)
+    assert result == fake_cwd.name
 
 
-@patch("pathlib.Path.exists")
-@patch("pathlib.Path.mkdir")
-def test_get_normalized_project_dir_errors(mock_mkdir, mock_exists, mock_repo):
+@patch.object(Path, "mkdir")
+def test_get_normalized_project_dir_errors(mock_mkdir, mock_repo, monkeypatch):
     """Test error handling in project directory normalization."""
     repo_root = "/path/to/repo"
-    mock_exists.return_value = False
+    monkeypatch.setattr(Path, "exists", lambda self: False)
 
     # Test with non-existent directory
     with pytest.raises(SystemExit) as exc_info:
@@ -150,6 +162,28 @@ def test_display_panel_message_error(capsys):
     assert "Error" in captured.out
 
 
+def test_batch_panels_defers_output(capsys):
+    """Test panels are held back until the batch ends."""
+    with batch_panels():
+        display_panel_message("First", "one", "blue")
+        with batch_panels():
+            display_panel_message("Second", "two", "blue")
+        assert capsys.readouterr().out == ""
+
+    output = capsys.readouterr().out
+    assert output.index("one") < output.index("two")
+
+
+def test_batch_panels_flushes_on_exit(capsys):
+    """Test deferred panels are still shown when the batch exits early."""
+    with pytest.raises(SystemExit):
+        with batch_panels():
+            display_panel_message("Error", "Something went wrong", "red")
+            sys.exit(1)
+
+    assert "Something went wrong" in capsys.readouterr().out
+
+
 @pytest.fixture
 def mock_release_mate_dir(tmp_path):
     """Create a mock .release-mate directory with test projects."""
@@ -160,34 +194,111 @@ def mock_release_mate_dir(tmp_path):
     return release_mate_dir
 
 
-@patch("os.path.exists", return_value=True)
-@patch("git.Repo")
-def test_get_available_project_ids(mock_repo, mock_exists, mock_release_mate_dir):
-    """Test retrieving available project IDs."""
-    mock_repo.return_value.git.rev_parse.return_value = str(
-        mock_release_mate_dir.parent)
-    with patch("pathlib.Path.home", return_value=mock_release_mate_dir.parent):
-        project_ids = get_available_project_ids()
-        assert set(project_ids) == {"project1", "project2"}
+def test_cached_project_ids(mock_release_mate_dir, isolated_cache_home):
+    """Test completion project IDs are served from disk until the directory changes."""
+    repo_root = str(mock_release_mate_dir.parent)
+    assert set(_cached_project_ids(repo_root)) == {"project1", "project2"}
+    assert list((isolated_cache_home / "release-mate").glob("completions-*.json"))
+
+    with patch.object(api, "_iter_project_configs") as mock_configs:
+        assert set(_cached_project_ids(repo_root)) == {"project1", "project2"}
+        mock_configs.assert_not_called()
+
+    (mock_release_mate_dir / "project3.toml").touch()
+    os.utime(mock_release_mate_dir, ns=(0, 1))
+    assert set(_cached_project_ids(repo_root)) == {
+        "project1", "project2", "project3"}
+
+
+def test_project_id_completion(mock_release_mate_dir, monkeypatch):
+    """Test project ID completion filters on the typed prefix."""
+    monkeypatch.setattr(os, "getcwd", lambda: str(mock_release_mate_dir.parent))
+    with patch("git.Repo") as mock_git_repo:
+        (mock_release_mate_dir.parent / ".git").mkdir()
+        assert project_id_completion(None, None, "project1") == ["project1"]
+        mock_git_repo.assert_not_called()
+
+
+def test_find_repo_root(tmp_path):
+    """Test the repository root is found by walking up to the .git entry."""
+    (tmp_path / ".git").write_text("gitdir: /elsewhere\n")
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+
+    assert _find_repo_root(str(nested)) == str(tmp_path)
+
+
+def test_current_branch(tmp_path):
+    """Test the branch is read from HEAD, following worktree gitdir pointers."""
+    git_dir = tmp_path / "repo" / ".git"
+    git_dir.mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/feature/x\n")
+    assert _current_branch(str(git_dir.parent)) == "feature/x"
+
+    (git_dir / "HEAD").write_text("0123456789abcdef0123456789abcdef01234567\n")
+    assert _current_branch(str(git_dir.parent)) is None
+
+    worktree_dir = tmp_path / "admin"
+    worktree_dir.mkdir()
+    (worktree_dir / "HEAD").write_text("ref: refs/heads/release\n")
+    worktree = tmp_path / "worktree"
+    worktree.mkdir()
+    (worktree / ".git").write_text(f"gitdir: {worktree_dir}\n")
+    assert _current_branch(str(worktree)) == "release"
+
+    assert _current_branch(str(tmp_path / "missing")) is None
+
+
+def test_remote_url(tmp_path):
+    """Test the remote URL is read from the config shared with linked worktrees."""
+    git_dir = tmp_path / "repo" / ".git"
+    git_dir.mkdir(parents=True)
+    (git_dir / "config").write_text(
+        '[core]\n\tbare = false\n'
+        '[remote "upstream"]\n\turl = https://example.com/upstream.git\n'
+        '[remote "origin"]\n\tfetch = +refs/heads/*:refs/remotes/origin/*\n'
+        '\turl = git@github.com:user/repo.git\n')
+    assert _remote_url(str(git_dir.parent)) == "git@github.com:user/repo.git"
+    assert _remote_url(str(git_dir.parent), "missing") is None
+
+    admin_dir = git_dir / "worktrees" / "wt"
+    admin_dir.mkdir(parents=True)
+    (admin_dir / "commondir").write_text("../..\n")
+    worktree = tmp_path / "wt"
+    worktree.mkdir()
+    (worktree / ".git").write_text(f"gitdir: {admin_dir}\n")
+    assert _remote_url(str(worktree)) == "git@github.com:user/repo.git"
+
+    assert _remote_url(str(tmp_path / "missing")) is None
+
+
+def test_iter_project_configs(mock_release_mate_dir):
+    """Test project enumeration skips non-TOML entries and missing directories."""
+    (mock_release_mate_dir / "notes.txt").touch()
+    (mock_release_mate_dir / "nested.toml").mkdir()
+
+    configs = dict(_iter_project_configs(mock_release_mate_dir))
+    assert configs == {
+        "project1": mock_release_mate_dir / "project1.toml",
+        "project2": mock_release_mate_dir / "project2.toml",
+    }
+    assert list(_iter_project_configs(mock_release_mate_dir / "missing")) == []
 
 
 def test_cli_version(cli_runner):
     """Test the version command of the CLI."""
-    result = cli_runner.invoke(cli, ["--version"])
+    result = cli_runner.invoke(cli, ["--version"], catch_exceptions=False)
     assert result.exit_code == 0
     assert "version" in result.output
 
 
-@patch("os.path.exists")
-@patch("release_mate.api.cookiecutter")
-@patch("pathlib.Path.mkdir")
-@patch("pathlib.Path.exists", return_value=False)
-@patch("pkg_resources.resource_filename")
-@patch("release_mate.api.get_normalized_project_dir")
-def test_cli_init_command(mock_get_normalized_project_dir, mock_resource_filename, mock_path_exists, mock_mkdir, mock_cookiecutter, mock_exists, cli_runner, mock_repo):
+@patch("cookiecutter.main.cookiecutter")
+@patch.object(Path, "mkdir")
+@patch.object(api, "get_normalized_project_dir")
+def test_cli_init_command(mock_get_normalized_project_dir, mock_mkdir, mock_cookiecutter, cli_runner, mock_repo, monkeypatch):
     """Test the init command of the CLI."""
-    mock_resource_filename.return_value = "/path/to/template"
     mock_get_normalized_project_dir.return_value = "."
+    monkeypatch.setattr(Path, "exists", lambda self: False)
 
     # Mock os.path.exists to return False for pyproject.toml, poetry.lock, and package-meta-data.xml
     def mock_exists_side_effect(path):
@@ -197,7 +308,7 @@ def test_cli_init_command(mock_get_normalized_project_dir, mock_resource_filenam
             return False
         return True
 
-    mock_exists.side_effect = mock_exists_side_effect
+    monkeypatch.setattr(os.path, "exists", mock_exists_side_effect)
 
     with patch("git.Repo") as mock_git_repo:
         mock_git_repo.return_value = mock_repo
@@ -216,7 +327,7 @@ def test_cli_init_command(mock_get_normalized_project_dir, mock_resource_filenam
 
         # Verify cookiecutter was called with correct arguments
         mock_cookiecutter.assert_called_once_with(
-            "/path/to/template",
+            str(Path(release_mate.__file__).parent / "templates" / "project"),
             no_input=True,
             output_dir="/path/to/repo",
             extra_context={
@@ -250,120 +361,124 @@ def test_build_version_args():
     assert args == ["--noop", "--minor", "--no-commit", "--no-changelog"]
 
 
+@pytest.mark.parametrize("func, subcommand", [
+    (run_semantic_release, "version"),
+    (run_semantic_release_changelog, "changelog"),
+])
 @patch("subprocess.run")
-@patch("os.getcwd")
 @patch("os.chdir")
-def test_run_semantic_release_success(mock_chdir, mock_getcwd, mock_run):
+def test_run_semantic_release_success(mock_chdir, mock_run, func, subcommand):
     """Test successful semantic-release command execution."""
-    mock_getcwd.return_value = "/original/dir"
     mock_run.return_value = MagicMock(
-        stdout="Version updated",
+        stdout="Updated",
         stderr="",
         returncode=0
     )
 
     config_file = Path("/path/to/config")
-    args = ["--noop"]
-    repo_path = "/path/to/repo"
-
-    run_semantic_release(config_file, args, repo_path)
+    func(config_file, ["--noop"], "/path/to/repo")
 
-    # Verify directory changes
-    assert mock_chdir.call_args_list == [
-        call("/path/to/repo"),
-        call("/original/dir")
-    ]
+    # The process working directory is left alone
+    mock_chdir.assert_not_called()
 
-    # Verify semantic-release command
+    # Verify semantic-release command streams straight to the terminal
     mock_run.assert_called_once_with(
-        ["semantic-release", "-c", str(config_file), "--noop", "version"],
+        ["semantic-release", "-c", str(config_file), "--noop", subcommand],
         check=True,
-        capture_output=True,
-        text=True
+        cwd="/path/to/repo"
     )
 
 
 @patch("subprocess.run")
-@patch("os.getcwd")
-@patch("os.chdir")
-def test_run_semantic_release_failure(mock_chdir, mock_getcwd, mock_run):
-    """Test semantic-release command failure."""
-    mock_getcwd.return_value = "/original/dir"
-    error = subprocess.CalledProcessError(1, "cmd")
-    error.stdout = ""
-    error.stderr = "Failed to update version"
-    mock_run.side_effect = error
-
+def test_run_semantic_release_buffers_output_in_batch(mock_run, capsys):
+    """Test output is captured into a panel while panels are being batched."""
+    mock_run.return_value = MagicMock(stdout="Version updated", stderr="")
     config_file = Path("/path/to/config")
-    args = ["--noop"]
-    repo_path = "/path/to/repo"
 
-    with pytest.raises(SystemExit) as exc_info:
-        run_semantic_release(config_file, args, repo_path)
+    with batch_panels():
+        run_semantic_release(config_file, ["--noop"], "/path/to/repo")
 
-    assert exc_info.value.code == 1
-    assert mock_chdir.call_args_list == [
-        call("/path/to/repo"),
-        call("/original/dir")
-    ]
+    mock_run.assert_called_once_with(
+        ["semantic-release", "-c", str(config_file), "--noop", "version"],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd="/path/to/repo"
+    )
+    assert "Versioning Logs" in capsys.readouterr().out
 
 
 @patch("subprocess.run")
-@patch("os.getcwd")
-@patch("os.chdir")
-def test_run_semantic_release_changelog_success(mock_chdir, mock_getcwd, mock_run):
-    """Test successful semantic-release changelog command execution."""
-    mock_getcwd.return_value = "/original/dir"
-    mock_run.return_value = MagicMock(
-        stdout="Changelog updated",
-        stderr="",
-        returncode=0
-    )
-
+def test_run_semantic_release_print_flag_streams_output(mock_run):
+    """Test print flags let semantic-release write straight to the terminal."""
     config_file = Path("/path/to/config")
-    args = ["--noop"]
-    repo_path = "/path/to/repo"
 
-    run_semantic_release_changelog(config_file, args, repo_path)
+    run_semantic_release(config_file, ["--print"], "/path/to/repo")
 
-    # Verify directory changes
-    assert mock_chdir.call_args_list == [
-        call("/path/to/repo"),
-        call("/original/dir")
-    ]
-
-    # Verify semantic-release command
     mock_run.assert_called_once_with(
-        ["semantic-release", "-c", str(config_file), "--noop", "changelog"],
+        ["semantic-release", "-c", str(config_file), "version", "--print"],
         check=True,
-        capture_output=True,
-        text=True
+        cwd="/path/to/repo"
     )
 
 
+@pytest.mark.parametrize("func", [run_semantic_release, run_semantic_release_changelog])
 @patch("subprocess.run")
-@patch("os.getcwd")
 @patch("os.chdir")
-def test_run_semantic_release_changelog_failure(mock_chdir, mock_getcwd, mock_run):
-    """Test semantic-release changelog command failure."""
-    mock_getcwd.return_value = "/original/dir"
+def test_run_semantic_release_failure(mock_chdir, mock_run, func):
+    """Test semantic-release command failure."""
     error = subprocess.CalledProcessError(1, "cmd")
     error.stdout = ""
-    error.stderr = "Failed to update changelog"
+    error.stderr = "Failed to update"
     mock_run.side_effect = error
 
-    config_file = Path("/path/to/config")
-    args = ["--noop"]
-    repo_path = "/path/to/repo"
-
     with pytest.raises(SystemExit) as exc_info:
-        run_semantic_release_changelog(config_file, args, repo_path)
+        func(Path("/path/to/config"), ["--noop"], "/path/to/repo")
 
     assert exc_info.value.code == 1
-    assert mock_chdir.call_args_list == [
-        call("/path/to/repo"),
-        call("/original/dir")
-    ]
+    mock_chdir.assert_not_called()
+
+
+@patch("subprocess.run")
+@patch.object(api, "_semantic_release_entrypoint")
+def test_run_semantic_release_in_process(mock_entrypoint, mock_run, tmp_path):
+    """Test semantic-release runs inside the interpreter without spawning a subprocess."""
+    cwd = os.getcwd()
+    mock_entrypoint.return_value.main.side_effect = lambda **kwargs: print(os.getcwd())
+
+    result = _run_semantic_release_in_process(
+        ["semantic-release", "-c", "config.toml", "version", "--print"], str(tmp_path))
+
+    mock_entrypoint.return_value.main.assert_called_once_with(
+        args=["-c", "config.toml", "version", "--print"],
+        prog_name="semantic-release",
+        standalone_mode=False
+    )
+    mock_run.assert_not_called()
+    assert result.returncode == 0
+    assert result.stdout == f"{tmp_path}\n"
+    assert os.getcwd() == cwd
+
+
+@patch.object(api, "_semantic_release_entrypoint")
+def test_run_semantic_release_in_process_failure(mock_entrypoint, tmp_path):
+    """Test in-process semantic-release failures surface as CalledProcessError."""
+    mock_entrypoint.return_value.main.side_effect = SystemExit(2)
+
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        _run_semantic_release_in_process(
+            ["semantic-release", "-c", "config.toml", "version"], str(tmp_path))
+    assert exc_info.value.returncode == 2
+
+
+@patch("subprocess.run")
+@patch.object(api, "_semantic_release_entrypoint", return_value=None)
+def test_run_semantic_release_in_process_fallback(mock_entrypoint, mock_run):
+    """Test a subprocess is used when semantic-release cannot be imported."""
+    cmd = ["semantic-release", "-c", "config.toml", "version"]
+    _run_semantic_release_in_process(cmd, "/path/to/repo")
+    mock_run.assert_called_once_with(
+        cmd, check=True, capture_output=True, text=True, cwd="/path/to/repo")
 
 
 def test_identify_branch(tmp_path):
@@ -392,6 +507,20 @@ version_variable = "example/__init__.py:__version__"
     assert branch is None
 
 
+def test_identify_branch_cached(tmp_path):
+    """Test branch lookups reuse the parsed file until it changes."""
+    config_file = tmp_path / "config.toml"
+    config_file.write_text("[tool.semantic_release.branches.main]\n")
+
+    with patch("builtins.open", wraps=open) as mock_open:
+        assert identify_branch(config_file) == "main"
+        assert identify_branch(config_file) == "main"
+        assert mock_open.call_count == 1
+
+    config_file.write_text("[tool.semantic_release.branches.develop]\n")
+    assert identify_branch(config_file) == "develop"
+
+
 def test_identify_branch_error(tmp_path):
     """Test error handling in branch identification."""
     config_file = tmp_path / "config.toml"
@@ -410,18 +539,19 @@ branch = "main"
     assert branch is None
 
 
-@patch("release_mate.api.run_semantic_release")
-@patch("release_mate.api.get_project_config_file")
+@patch.object(api, "run_semantic_release")
+@patch.object(api, "get_project_config_file")
 @patch("git.Repo")
 def test_version_worker(mock_repo, mock_get_config, mock_run_semantic_release):
     """Test version worker function."""
     # Setup mocks
     mock_repo.return_value.active_branch.name = "main"
     mock_get_config.return_value = Path("/path/to/config.toml")
-    mock_repo.return_value.git.rev_parse.return_value = "/path/to/repo"
+    mock_repo.return_value.remote.return_value.urls = ["https://github.com/user/repo.git"]
+    mock_repo.return_value.working_tree_dir = "/path/to/repo"
 
     # Mock config file existence
-    with patch("pathlib.Path.exists", return_value=True):
+    with patch.object(Path, "exists", return_value=True):
         # Test with default arguments
         version_worker(project_id="test-project")
         mock_run_semantic_release.assert_called_once()
@@ -450,24 +580,25 @@ def test_version_worker(mock_repo, mock_get_config, mock_run_semantic_release):
         assert "--no-push" in args
 
 
-@patch("release_mate.api.run_semantic_release")
-@patch("release_mate.api.get_project_config_file")
+@patch.object(api, "run_semantic_release")
+@patch.object(api, "get_project_config_file")
 @patch("git.Repo")
 def test_version_worker_error_handling(mock_repo, mock_get_config, mock_run_semantic_release):
     """Test version worker error handling."""
     # Setup mocks
     mock_repo.return_value.active_branch.name = "main"
     mock_get_config.return_value = Path("/path/to/config.toml")
-    mock_repo.return_value.git.rev_parse.return_value = "/path/to/repo"
+    mock_repo.return_value.remote.return_value.urls = ["https://github.com/user/repo.git"]
+    mock_repo.return_value.working_tree_dir = "/path/to/repo"
 
     # Test with non-existent config file
-    with patch("pathlib.Path.exists", return_value=False):
+    with patch.object(Path, "exists", return_value=False):
         with pytest.raises(SystemExit) as exc_info:
             version_worker(project_id="test-project")
         assert exc_info.value.code == 1
 
     # Test with semantic-release error
-    with patch("pathlib.Path.exists", return_value=True):
+    with patch.object(Path, "exists", return_value=True):
         mock_run_semantic_release.side_effect = Exception(
             "Semantic release failed")
         with pytest.raises(SystemExit) as exc_info:
@@ -498,95 +629,117 @@ def test_create_git_tag_failure(mock_repo):
     create_git_tag("v1.0.0")
 
 
-def test_batch_version_success(cli_runner):
+def _project_configs(*ids):
+    """Build the (project ID, config path) pairs _iter_project_configs yields."""
+    return [(project_id, Path(f"/path/to/repo/.release-mate/{project_id}.toml")) for project_id in ids]
+
+
+def test_batch_version_success(cli_runner, api_stubs):
     """Test successful batch version update."""
-    with patch("release_mate.api.get_available_project_ids") as mock_get_projects, \
-            patch("release_mate.api.validate_git_repository") as mock_validate_repo, \
-            patch("release_mate.api.version_worker") as mock_version_worker, \
-            patch("release_mate.api.get_git_info") as mock_get_git_info, \
-            patch("release_mate.api.get_project_config_file") as mock_get_config, \
-            patch("release_mate.api.identify_branch") as mock_identify_branch, \
-            patch("pathlib.Path.glob") as mock_glob:
-
-        mock_repo_instance = MagicMock()
-        mock_repo_instance.active_branch.name = "main"
-        mock_repo_instance.git.checkout.return_value = None
-        mock_validate_repo.return_value = mock_repo_instance
-        mock_version_worker.return_value = None
-        mock_get_git_info.return_value = ("main", "", "", "/path/to/repo")
-        mock_get_config.return_value = Path("/path/to/config")
-        mock_identify_branch.return_value = "main"
-        mock_glob.return_value = [Path("/path/to/repo/.release-mate/project1.toml"),
-                                  Path("/path/to/repo/.release-mate/project2.toml")]
-
-        result = cli_runner.invoke(cli, ["batch-version", "--minor"])
-        assert result.exit_code == 0
-        assert mock_version_worker.call_count == 2
+    api_stubs.identify.return_value = "main"
+    api_stubs.configs.return_value = _project_configs("project1", "project2")
+
+    with patch.object(api, "version_worker") as mock_version_worker:
+        result = cli_runner.invoke(cli, ["batch-version", "--minor"], catch_exceptions=False)
+    assert result.exit_code == 0
+    assert mock_version_worker.call_count == 2
+
+
+def test_batch_version_restores_branch_on_exit(cli_runner, api_stubs):
+    """Test batch version attempts every project when some exit and returns to the original branch."""
+    api_stubs.identify.side_effect = ["develop", "develop", "main"]
+    api_stubs.configs.return_value = _project_configs("project1", "project2", "project3")
+
+    with patch.object(api, "version_worker",
+                      side_effect=[None, SystemExit(2), SystemExit(1)]) as mock_version_worker:
+        result = cli_runner.invoke(cli, ["batch-version"], catch_exceptions=False)
+    assert result.exit_code == 2
+    assert [c.kwargs["project_id"] for c in mock_version_worker.call_args_list] == [
+        "project3", "project1", "project2"]
+    assert [c.args for c in api_stubs.validate.return_value.git.checkout.call_args_list] == [
+        ("develop",), ("main",)]
+
+
+def test_batch_version_groups_projects_by_branch(cli_runner, api_stubs):
+    """Test batch version checks out each branch once, starting with the current one."""
+    api_stubs.identify.side_effect = ["develop", "main", "develop", "main"]
+    api_stubs.configs.return_value = _project_configs(*(f"project{i}" for i in range(1, 5)))
+
+    with patch.object(api, "version_worker") as mock_version_worker:
+        result = cli_runner.invoke(cli, ["batch-version"], catch_exceptions=False)
+    assert result.exit_code == 0
+    assert [c.kwargs["project_id"] for c in mock_version_worker.call_args_list] == [
+        "project2", "project4", "project1", "project3"]
+    assert [c.args for c in api_stubs.validate.return_value.git.checkout.call_args_list] == [
+        ("develop",), ("main",)]
 
 
-def test_batch_version_no_projects(cli_runner):
+def test_batch_version_no_projects(cli_runner, api_stubs):
     """Test batch version with no available projects."""
-    with patch("release_mate.api.get_available_project_ids") as mock_get_projects, \
-            patch("release_mate.api.validate_git_repository") as mock_validate_repo, \
-            patch("release_mate.api.get_git_info") as mock_get_git_info:
+    api_stubs.configs.return_value = []
 
-        mock_get_projects.return_value = []
-        mock_validate_repo.return_value = MagicMock()
-        mock_get_git_info.return_value = ("main", "", "", "/path/to/repo")
+    result = cli_runner.invoke(cli, ["batch-version", "--minor"], catch_exceptions=False)
+    assert result.exit_code == 0  # Should not fail, just skip processing
 
-        result = cli_runner.invoke(cli, ["batch-version", "--minor"])
-        assert result.exit_code == 0  # Should not fail, just skip processing
 
+def test_batch_version_dry_run_uses_worktrees(cli_runner, api_stubs, empty_toml):
+    """Test dry-run batch versioning runs each project in its own worktree."""
+    api_stubs.identify.side_effect = ["main", "develop"]
+    api_stubs.get_config.return_value = empty_toml
+    api_stubs.configs.return_value = _project_configs("project1", "project2")
 
-def test_changelog_success(cli_runner):
+    result = cli_runner.invoke(cli, ["batch-version", "--noop"], catch_exceptions=False)
+    assert result.exit_code == 0
+    assert api_stubs.run.call_count == 2
+    repo = api_stubs.validate.return_value
+    repo.git.checkout.assert_not_called()
+
+    worktree_calls = repo.git.worktree.call_args_list
+    added = {c.args[2]: c.args[3] for c in worktree_calls if c.args[0] == "add"}
+    removed = {c.args[2] for c in worktree_calls if c.args[0] == "remove"}
+    assert sorted(added.values()) == ["develop", "main"]
+    assert removed == set(added)
+    assert {c.args[2] for c in api_stubs.run.call_args_list} == set(added)
+    assert not any(os.path.exists(path) for path in added)
+
+
+def test_batch_version_dry_run_aggregates_exit_codes(cli_runner, api_stubs, empty_toml):
+    """Test one failing dry run does not stop the others and sets the exit code."""
+    api_stubs.identify.return_value = "main"
+    api_stubs.get_config.return_value = empty_toml
+    api_stubs.run.side_effect = [SystemExit(1), None]
+    api_stubs.configs.return_value = _project_configs("project1", "project2")
+
+    result = cli_runner.invoke(cli, ["batch-version", "--noop"], catch_exceptions=False)
+    assert result.exit_code == 1
+    assert api_stubs.run.call_count == 2
+    assert "exited with status 1" in result.output
+
+
+def test_changelog_success(cli_runner, api_stubs, monkeypatch):
     """Test successful changelog generation."""
-    with patch("release_mate.api.validate_git_repository") as mock_validate_repo, \
-            patch("release_mate.api.get_project_config_file") as mock_get_config, \
-            patch("release_mate.api.run_semantic_release_changelog") as mock_run_changelog, \
-            patch("release_mate.api.get_git_info") as mock_get_git_info, \
-            patch("release_mate.api.identify_branch") as mock_identify_branch, \
-            patch("pathlib.Path.exists") as mock_exists:
-
-        mock_repo_instance = MagicMock()
-        mock_repo_instance.active_branch.name = "main"
-        mock_validate_repo.return_value = mock_repo_instance
-        mock_config_path = Path("/path/to/config")
-        mock_get_config.return_value = mock_config_path
-        mock_exists.return_value = True
-        mock_run_changelog.return_value = None
-        mock_get_git_info.return_value = ("main", "", "", "/path/to/repo")
-        mock_identify_branch.return_value = "main"
-
-        result = cli_runner.invoke(cli, ["changelog"])
-        assert result.exit_code == 0
+    api_stubs.get_config.return_value = Path("/path/to/config")
+    api_stubs.identify.return_value = "main"
+    monkeypatch.setattr(Path, "exists", lambda self: True)
+
+    result = cli_runner.invoke(cli, ["changelog"], catch_exceptions=False)
+    assert result.exit_code == 0
 
 
-def test_changelog_failure(cli_runner):
+def test_changelog_failure(cli_runner, api_stubs, monkeypatch):
     """Test changelog generation failure."""
-    with patch("release_mate.api.validate_git_repository") as mock_validate_repo, \
-            patch("release_mate.api.get_project_config_file") as mock_get_config, \
-            patch("release_mate.api.run_semantic_release_changelog") as mock_run_changelog, \
-            patch("release_mate.api.get_git_info") as mock_get_git_info, \
-            patch("release_mate.api.identify_branch") as mock_identify_branch, \
-            patch("pathlib.Path.exists") as mock_exists:
-
-        mock_repo_instance = MagicMock()
-        mock_repo_instance.active_branch.name = "main"
-        mock_validate_repo.return_value = mock_repo_instance
-        mock_config_path = Path("/path/to/config")
-        mock_get_config.return_value = mock_config_path
-        mock_exists.return_value = True
-        mock_run_changelog.side_effect = subprocess.CalledProcessError(
-            1, "semantic-release changelog", stderr=b"Error generating changelog")
-        mock_get_git_info.return_value = ("main", "", "", "/path/to/repo")
-        mock_identify_branch.return_value = "main"
-
-        result = cli_runner.invoke(cli, ["changelog"])
-        assert result.exit_code == 1
-
-
-@patch("release_mate.api.validate_git_repository")
-@patch("release_mate.api.get_project_config_file")
+    api_stubs.get_config.return_value = Path("/path/to/config")
+    api_stubs.identify.return_value = "main"
+    api_stubs.changelog.side_effect = subprocess.CalledProcessError(
+        1, "semantic-release changelog", stderr=b"Error generating changelog")
+    monkeypatch.setattr(Path, "exists", lambda self: True)
+
+    result = cli_runner.invoke(cli, ["changelog"], catch_exceptions=False)
+    assert result.exit_code == 1
+
+
+@patch.object(api, "validate_git_repository")
+@patch.object(api, "get_project_config_file")
 def test_version_worker_print_version(mock_get_config, mock_validate_repo, mock_repo, tmp_path):
     """Test version worker with print version flag."""
     mock_validate_repo.return_value = mock_repo
@@ -601,8 +754,8 @@ branch = "main"
 
     mock_get_config.return_value = config_file
 
-    with patch("release_mate.api.run_semantic_release") as mock_run, \
-            patch("release_mate.api.get_git_info") as mock_get_git_info:
+    with patch.object(api, "run_semantic_release") as mock_run, \
+            patch.object(api, "get_git_info") as mock_get_git_info:
         mock_run.return_value = None  # run_semantic_release doesn't return anything
         mock_get_git_info.return_value = ("main", "", "", str(tmp_path))
 
@@ -1,99 +1,45 @@
 """Additional test cases for CLI functionality to increase coverage."""
 import subprocess
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
-from click.testing import CliRunner
 
-from release_mate.api import (_execute_publish, build_version_args,
-                              display_panel_message, get_git_info,
-                              get_normalized_project_dir,
+from release_mate import api
+from release_mate.api import (CommandCompletion, _execute_publish,
+                              _render_bash_completion, _render_fish_completion,
+                              build_version_args, display_panel_message,
+                              get_normalized_project_dir, get_project_config,
                               get_project_config_file, identify_branch,
-                              run_semantic_release,
-                              run_semantic_release_changelog, version_worker)
+                              install_shell_completion, publish_worker,
+                              version_worker)
 
+pytestmark = pytest.mark.usefixtures("stub_subprocess")
 
-@pytest.fixture
-def cli_runner():
-    """Create a CLI runner for testing click commands."""
-    return CliRunner()
 
-
-@pytest.fixture
-def mock_repo():
-    """Create a mock git repository."""
-    mock = MagicMock()
-    mock.active_branch.name = "main"
-    mock.git.rev_parse.return_value = "/mock/repo/path"
-    return mock
-
-
-def test_get_git_info_http_url(mock_repo):
-    """Test get_git_info with HTTP remote URL."""
-    mock_repo.remote().urls = iter(["https://github.com/user/repo.git"])
-    branch, url, domain, root = get_git_info(mock_repo)
-    assert branch == "main"
-    assert url == "https://github.com/user/repo.git"
-    assert domain == "https://github.com"
-    assert root == "/mock/repo/path"
-
-
-def test_get_git_info_ssh_url(mock_repo):
-    """Test get_git_info with SSH remote URL."""
-    mock_repo.remote().urls = iter(["git@github.com:user/repo.git"])
-    branch, url, domain, root = get_git_info(mock_repo)
-    assert branch == "main"
-    assert url == "git@github.com:user/repo.git"
-    assert domain == "https://github.com"
-    assert root == "/mock/repo/path"
-
-
-def test_run_semantic_release_success(tmp_path):
-    """Test successful semantic-release execution."""
-    config_file = tmp_path / "test.toml"
-    config_file.touch()
-
-    with patch("subprocess.run") as mock_run:
-        mock_run.return_value.stdout = "Version updated"
-        mock_run.return_value.stderr = ""
-        run_semantic_release(config_file, ["--noop"], str(tmp_path))
-        mock_run.assert_called_once()
-
-
-def test_run_semantic_release_changelog_success(tmp_path):
-    """Test successful semantic-release changelog execution."""
-    config_file = tmp_path / "test.toml"
-    config_file.touch()
-
-    with patch("subprocess.run") as mock_run:
-        mock_run.return_value.stdout = "Changelog updated"
-        mock_run.return_value.stderr = ""
-        run_semantic_release_changelog(config_file, ["--noop"], str(tmp_path))
-        mock_run.assert_called_once()
-
-
-@patch("pathlib.Path.exists")
-def test_version_worker_print_flags(mock_exists, cli_runner, mock_repo):
+def test_version_worker_print_flags(patched_version_deps):
     """Test version worker with print flags."""
-    with patch("release_mate.api.validate_git_repository") as mock_validate, \
-            patch("release_mate.api.get_project_config_file") as mock_get_config, \
-            patch("release_mate.api.run_semantic_release") as mock_run:
+    # Test print version
+    version_worker(project_id="test", print_version=True)
+    patched_version_deps.run.assert_called_with(
+        patched_version_deps.config, ["--print"], "/mock/repo/path", in_process=False)
 
-        mock_validate.return_value = mock_repo
-        config_file = Path("/mock/repo/path/.release-mate/test.toml")
-        mock_get_config.return_value = config_file
-        mock_exists.return_value = True
+    # Test print tag
+    version_worker(project_id="test", print_tag=True)
+    patched_version_deps.run.assert_called_with(
+        patched_version_deps.config, ["--print-tag"], "/mock/repo/path", in_process=False)
 
-        # Test print version
-        version_worker(project_id="test", print_version=True)
-        mock_run.assert_called_with(
-            config_file, ["--print"], "/mock/repo/path")
 
-        # Test print tag
-        version_worker(project_id="test", print_tag=True)
-        mock_run.assert_called_with(
-            config_file, ["--print-tag"], "/mock/repo/path")
+def test_version_worker_reuses_context(patched_version_deps, fake_repo):
+    """Test version worker skips repository discovery when given a context."""
+    with patch.object(api, "get_git_info") as mock_get_git_info:
+        version_worker(project_id="test", print_version=True,
+                       _ctx=(fake_repo, "main", "/mock/repo/path"))
+
+    patched_version_deps.validate.assert_not_called()
+    mock_get_git_info.assert_not_called()
+    patched_version_deps.run.assert_called_once_with(
+        patched_version_deps.config, ["--print"], "/mock/repo/path", in_process=False)
 
 
 def test_build_version_args_combinations():
@@ -146,31 +92,15 @@ def test_build_version_args_combinations():
     assert "--no-vcs-release" in args
 
 
-@patch("os.path.exists")
-@patch("os.getcwd")
-def test_get_normalized_project_dir_current_dir(mock_getcwd, mock_exists, tmp_path):
+def test_get_normalized_project_dir_current_dir(fake_cwd):
     """Test normalizing project directory with current directory."""
-    mock_exists.return_value = True
-    mock_getcwd.return_value = str(tmp_path)
-    result = get_normalized_project_dir(".", str(tmp_path))
+    result = get_normalized_project_dir(".", str(fake_cwd))
     assert result == "."
 
 
-def test_identify_branch_with_multiple_branches(tmp_path):
+def test_identify_branch_with_multiple_branches(multi_branch_config):
     """Test identifying branch from config with multiple branch sections."""
-    config_content = """
-[tool.semantic_release.branches.main]
-match = "main"
-prerelease = false
-
-[tool.semantic_release.branches.develop]
-match = "develop"
-prerelease = true
-"""
-    config_file = tmp_path / "test.toml"
-    config_file.write_text(config_content)
-
-    branch = identify_branch(config_file)
+    branch = identify_branch(multi_branch_config)
     assert branch == "main"  # Should return the first branch found
 
 
@@ -186,58 +116,190 @@ def test_get_project_config_file_absolute_path():
     config = get_project_config_file("test", "/absolute/path")
     assert config.is_absolute()
     assert str(config).endswith(".release-mate/test.toml")
+    assert get_project_config_file("test", "/absolute/path") is config
+
+
+def test_get_project_config_poetry_syntax(tmp_path, fake_repo):
+    """Test poetry syntax is detected from files in the project directory."""
+    (tmp_path / "poetry_app").mkdir()
+    (tmp_path / "poetry_app" / "pyproject.toml").touch()
+    (tmp_path / "plain_app").mkdir()
 
+    with patch.object(api, "validate_git_repository", return_value=fake_repo), \
+            patch.object(api, "get_git_info",
+                  return_value=("main", "", "", str(tmp_path))):
+        assert get_project_config("app", "poetry_app").poetry_syntax is True
+        assert get_project_config("app", "plain_app").poetry_syntax is False
 
-def test_execute_publish_success(tmp_path):
+
+def test_execute_publish_success(tmp_path, stub_subprocess):
     """Test successful publish execution."""
     config_file = tmp_path / "test.toml"
-    config_file.touch()
 
-    with patch("subprocess.run") as mock_run:
-        mock_run.return_value.stdout = "Published successfully"
-        mock_run.return_value.stderr = ""
-        _execute_publish(config_file, ["--noop"], str(tmp_path))
-        mock_run.assert_called_with(
-            ["semantic-release", "-c", str(config_file), "--noop", "publish"],
-            check=True, capture_output=True, text=True
-        )
+    stub_subprocess.return_value.stdout = "Published successfully"
+    stub_subprocess.return_value.stderr = ""
+    _execute_publish(config_file, ["--noop"], str(tmp_path))
+    stub_subprocess.assert_called_with(
+        ["semantic-release", "-c", str(config_file), "--noop", "publish"],
+        check=True, capture_output=True, text=True, cwd=str(tmp_path)
+    )
 
 
-def test_execute_publish_with_tag(tmp_path):
+def test_execute_publish_with_tag(tmp_path, stub_subprocess):
     """Test publish execution with specific tag."""
     config_file = tmp_path / "test.toml"
-    config_file.touch()
 
-    with patch("subprocess.run") as mock_run:
-        mock_run.return_value.stdout = "Published with tag"
-        mock_run.return_value.stderr = ""
-        _execute_publish(config_file, ["--tag=v1.0.0"], str(tmp_path))
-        mock_run.assert_called_with(
-            ["semantic-release", "-c",
-                str(config_file), "publish", "--tag=v1.0.0"],
-            check=True, capture_output=True, text=True
-        )
+    stub_subprocess.return_value.stdout = "Published with tag"
+    stub_subprocess.return_value.stderr = ""
+    _execute_publish(config_file, ["--tag=v1.0.0"], str(tmp_path))
+    stub_subprocess.assert_called_with(
+        ["semantic-release", "-c",
+            str(config_file), "publish", "--tag=v1.0.0"],
+        check=True, capture_output=True, text=True, cwd=str(tmp_path)
+    )
 
 
-def test_execute_publish_error(tmp_path):
+def test_execute_publish_error(tmp_path, stub_subprocess):
     """Test publish execution with error."""
     config_file = tmp_path / "test.toml"
-    config_file.touch()
 
-    with patch("subprocess.run") as mock_run:
-        mock_run.side_effect = subprocess.CalledProcessError(
-            1, "semantic-release", stderr="Failed to publish")
-        with pytest.raises(SystemExit):
-            _execute_publish(config_file, [], str(tmp_path))
+    stub_subprocess.side_effect = subprocess.CalledProcessError(
+        1, "semantic-release", stderr="Failed to publish")
+    with pytest.raises(SystemExit):
+        _execute_publish(config_file, [], str(tmp_path))
 
 
-@patch("pathlib.Path.exists")
-def test_publish_nonexistent_project(mock_exists, cli_runner, mock_repo):
+def test_publish_nonexistent_project(fake_repo, monkeypatch):
     """Test publish with non-existent project."""
-    with patch("release_mate.api.validate_git_repository") as mock_validate:
-        mock_validate.return_value = mock_repo
-        mock_exists.return_value = False
+    with patch.object(api, "validate_git_repository") as mock_validate:
+        mock_validate.return_value = fake_repo
+        monkeypatch.setattr(Path, "exists", lambda self: False)
 
-        from release_mate.api import publish_worker
         with pytest.raises(SystemExit):
             publish_worker(project_id="nonexistent")
+
+
+COMPLETION_COMMANDS = [
+    CommandCompletion(name="version", help="Perform a version bump.",
+                      options=["--id", "-i", "--noop"], project_id_options=["--id", "-i"]),
+    CommandCompletion(name="changelog", help="Generate a changelog.",
+                      options=["--noop"], project_id_argument=True),
+]
+
+
+@pytest.mark.parametrize("shell, rc_file, script", [
+    ("/bin/bash", ".bashrc", "completion.bash"),
+    ("/usr/bin/zsh", ".zshrc", "completion.zsh"),
+    ("/usr/bin/fish", ".config/fish/config.fish", "completion.fish"),
+])
+def test_install_shell_completion(shell, rc_file, script, tmp_path, monkeypatch, capsys):
+    """Test the completion script is generated and sourced once from the rc file."""
+    monkeypatch.setenv("SHELL", shell)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("XDG_DATA_HOME", raising=False)
+
+    install_shell_completion("release-mate", COMPLETION_COMMANDS)
+    install_shell_completion("release-mate", COMPLETION_COMMANDS)
+
+    script_file = tmp_path / ".local" / "share" / "release-mate" / script
+    content = (tmp_path / rc_file).read_text()
+    assert content.count(str(script_file)) == 2  # the existence test and the source
+    assert "already installed" in capsys.readouterr().out
+
+    generated = script_file.read_text()
+    assert "version" in generated and "changelog" in generated
+    assert "release-mate __complete_project_ids" in generated
+
+
+def test_install_shell_completion_empty_rc_file(tmp_path, monkeypatch):
+    """Test shell completion is appended to an existing empty rc file."""
+    monkeypatch.setenv("SHELL", "/bin/bash")
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    (tmp_path / ".bashrc").touch()
+
+    install_shell_completion("release-mate", COMPLETION_COMMANDS)
+
+    assert str(tmp_path / "data" / "release-mate" / "completion.bash") in (tmp_path / ".bashrc").read_text()
+
+
+@pytest.mark.parametrize("shell, rc_file, legacy", [
+    ("/bin/bash", ".bashrc",
+     'if command -v release-mate > /dev/null; then\n'
+     '  eval "$(_RELEASE_MATE_COMPLETE=bash_source release-mate 2>/dev/null || true)"\n'
+     'fi'),
+    ("/usr/bin/zsh", ".zshrc",
+     'if (( $+commands[release-mate] )); then\n'
+     '  eval "$(_RELEASE_MATE_COMPLETE=zsh_source release-mate 2>/dev/null || true)"\n'
+     'fi'),
+    ("/usr/bin/fish", ".config/fish/config.fish",
+     'if type -q release-mate\n'
+     '  eval (env _RELEASE_MATE_COMPLETE=fish_source release-mate 2>/dev/null; or true)\n'
+     'end'),
+])
+def test_install_shell_completion_replaces_legacy_setup(shell, rc_file, legacy, tmp_path, monkeypatch, capsys):
+    """Test the eval-based completion of earlier releases is replaced rather than kept alongside."""
+    monkeypatch.setenv("SHELL", shell)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    rc_path = tmp_path / rc_file
+    rc_path.parent.mkdir(parents=True, exist_ok=True)
+    rc_path.write_text(f"export EDITOR=vi\n\n# Release Mate completion\n{legacy}\nalias ll='ls -l'\n")
+
+    install_shell_completion("release-mate", COMPLETION_COMMANDS)
+
+    content = rc_path.read_text()
+    assert "_RELEASE_MATE_COMPLETE" not in content
+    assert content.startswith("export EDITOR=vi\n\n# Release Mate completion\n")
+    assert content.endswith("\nalias ll='ls -l'\n")
+    assert content.count(str(tmp_path / "data" / "release-mate")) == 2
+    assert "previous completion setup" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("user_setup", [
+    'if [ -n "$PS1" ]; then\n'
+    '  eval "$(_RELEASE_MATE_COMPLETE=bash_source release-mate)"\n'
+    "  alias ll='ls -l'\n"
+    'fi\n',
+    'if [ -f ~/.aliases ]; then . ~/.aliases; fi\n'
+    'eval "$(_RELEASE_MATE_COMPLETE=bash_source release-mate)"\n',
+])
+def test_install_shell_completion_keeps_hand_edited_setup(user_setup, tmp_path, monkeypatch, capsys):
+    """Test a completion setup the user edited by hand is left intact and reported."""
+    monkeypatch.setenv("SHELL", "/bin/bash")
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    rc_path = tmp_path / ".bashrc"
+    rc_path.write_text(user_setup)
+
+    install_shell_completion("release-mate", COMPLETION_COMMANDS)
+
+    content = rc_path.read_text()
+    assert content.startswith(user_setup)
+    assert str(tmp_path / "data" / "release-mate" / "completion.bash") in content[len(user_setup):]
+    assert "still loads completion through _RELEASE_MATE_COMPLETE" in capsys.readouterr().out
+
+
+def test_render_bash_completion():
+    """Test the bash script completes project IDs only where they are accepted."""
+    script = _render_bash_completion("release-mate", COMPLETION_COMMANDS)
+    assert 'compgen -W "version changelog"' in script
+    assert "--id|-i)" in script
+    assert 'if [[ "$cur" != -* ]]; then' in script
+    assert script.rstrip().endswith("complete -F _release_mate_completion release-mate")
+
+
+def test_render_fish_completion():
+    """Test the fish script declares subcommands, options and project IDs."""
+    script = _render_fish_completion("release-mate", COMPLETION_COMMANDS)
+    assert "-n __fish_use_subcommand -a version -d 'Perform a version bump.'" in script
+    assert "-s i -x -a '(release-mate __complete_project_ids 2>/dev/null)'" in script
+    assert "-l noop" in script
+
+
+def test_install_shell_completion_unsupported_shell(monkeypatch):
+    """Test shell completion rejects unknown shells."""
+    monkeypatch.setenv("SHELL", "/bin/tcsh")
+    with pytest.raises(SystemExit) as exc_info:
+        install_shell_completion("release-mate", COMPLETION_COMMANDS)
+    assert exc_info.value.code == 1
@@ -1,17 +1,21 @@
 """Additional tests for CLI commands and edge cases."""
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-from click.testing import CliRunner
 
+import release_mate
+from release_mate import api
 from release_mate.cli import cli
+from release_mate.commands.version import command as version_command
 
 
-@pytest.fixture
-def cli_runner():
-    """Create a CLI runner for testing click commands."""
-    return CliRunner()
+def _invoke_version(*args):
+    """Parse arguments for the version command and run it without the CLI runner."""
+    with version_command.make_context("version", list(args)) as ctx:
+        version_command.invoke(ctx)
 
 
 @pytest.fixture
@@ -26,85 +30,122 @@ version_variable = "release_mate/__init__.py:__version__"
     return config
 
 
+def test_cli_loads_only_invoked_command(cli_runner, monkeypatch):
+    """Test subcommand modules are imported only when their command is used."""
+    for name in list(sys.modules):
+        if name.startswith("release_mate.commands."):
+            monkeypatch.delitem(sys.modules, name)
+
+    result = cli_runner.invoke(cli, ["publish", "--help"], catch_exceptions=False)
+    assert result.exit_code == 0
+    assert "release_mate.commands.publish" in sys.modules
+    assert "release_mate.commands.version" not in sys.modules
+
+
+def test_main_version_skips_click():
+    """Test --version is answered without importing Click or the CLI."""
+    code = ("import sys; sys.argv = ['release-mate', '--version']; "
+            "from release_mate.__main__ import main; main(); "
+            "print('click' in sys.modules, 'release_mate.cli' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code],
+                            capture_output=True, text=True, check=True)
+
+    assert result.stdout.splitlines() == [
+        f"release-mate, version {release_mate.__version__}", "False False"]
+
+
+def test_cli_lists_all_commands(cli_runner):
+    """Test the group help lists every lazily loaded command."""
+    result = cli_runner.invoke(cli, ["--help"], catch_exceptions=False)
+    assert result.exit_code == 0
+    for name in ["batch-version", "changelog", "init", "install-completion", "publish", "version"]:
+        assert name in result.output
+
+
+def test_install_completion_describes_commands(cli_runner):
+    """Test install-completion passes the visible commands to the API."""
+    with patch.object(api, "install_shell_completion") as mock_install:
+        result = cli_runner.invoke(cli, ["install-completion"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    command_name, commands = mock_install.call_args.args
+    assert command_name == "release-mate"
+    by_name = {command.name: command for command in commands}
+    assert "__complete_project_ids" not in by_name
+    assert by_name["version"].project_id_options == ["--id", "-i"]
+    assert "--no-push" in by_name["version"].options
+    assert by_name["changelog"].project_id_argument
+    assert by_name["init"].project_id_options == []
+
+
+def test_complete_project_ids_command(cli_runner):
+    """Test the hidden completion command prints matching project IDs."""
+    with patch.object(api, "project_id_completion", return_value=["api", "app"]) as mock_completion:
+        result = cli_runner.invoke(cli, ["__complete_project_ids", "a"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ["api", "app"]
+    mock_completion.assert_called_once_with(None, None, "a")
+
+
 def test_version_command_help(cli_runner):
     """Test the help output of version command."""
-    result = cli_runner.invoke(cli, ["version", "--help"])
+    result = cli_runner.invoke(cli, ["version", "--help"], catch_exceptions=False)
     assert result.exit_code == 0
     assert "Perform a version bump" in result.output
 
 
-@patch("release_mate.api.validate_git_repository")
-@patch("release_mate.api.get_project_config_file")
+@patch.object(api, "validate_git_repository")
+@patch.object(api, "get_project_config_file")
 def test_version_command_invalid_project(mock_get_config, mock_validate, cli_runner):
     """Test version command with non-existent project."""
     mock_repo = MagicMock()
-    mock_repo.git.rev_parse.return_value = "/path/to/repo"
+    mock_repo.remote.return_value.urls = ["https://github.com/user/repo.git"]
+    mock_repo.working_tree_dir = "/path/to/repo"
     mock_validate.return_value = mock_repo
     mock_get_config.return_value = Path(
         "/path/to/repo/.release-mate/nonexistent.toml")
 
-    result = cli_runner.invoke(cli, ["version", "-i", "nonexistent"])
+    result = cli_runner.invoke(cli, ["version", "-i", "nonexistent"], catch_exceptions=False)
     assert result.exit_code == 1
     assert "Project 'nonexistent' does not exist in .release-mate directory" in result.output
 
 
-@patch("release_mate.api.validate_git_repository")
-@patch("release_mate.api.get_project_config_file")
-@patch("pathlib.Path.exists")
-def test_version_command_conflicting_flags(mock_exists, mock_get_config, mock_validate, cli_runner):
+@patch.object(api, "validate_git_repository")
+@patch.object(api, "get_project_config_file")
+def test_version_command_conflicting_flags(mock_get_config, mock_validate, cli_runner, monkeypatch):
     """Test version command with conflicting version bump flags."""
     mock_repo = MagicMock()
-    mock_repo.git.rev_parse.return_value = "/path/to/repo"
+    mock_repo.remote.return_value.urls = ["https://github.com/user/repo.git"]
+    mock_repo.working_tree_dir = "/path/to/repo"
     mock_validate.return_value = mock_repo
-    mock_exists.return_value = True
+    monkeypatch.setattr(Path, "exists", lambda self: True)
 
     result = cli_runner.invoke(cli, [
         "version",
         "--major",
         "--minor",
         "-i", "test"
-    ])
+    ], catch_exceptions=False)
     assert result.exit_code == 1
     assert "Only one version type flag can be specified at a time" in result.output
 
 
-@patch("release_mate.api.validate_git_repository")
-@patch("release_mate.api.get_project_config_file")
-@patch("pathlib.Path.exists")
-def test_changelog_invalid_tag(mock_exists, mock_get_config, mock_validate, cli_runner):
+def test_changelog_invalid_tag(patched_api, cli_runner):
     """Test changelog command with invalid release tag."""
-    mock_repo = MagicMock()
-    mock_repo.git.rev_parse.return_value = "/path/to/repo"
-    mock_validate.return_value = mock_repo
-    mock_exists.return_value = True
-
     result = cli_runner.invoke(cli, [
         "changelog",
         "test",
         "--post-to-release-tag", "invalid-tag"
-    ])
+    ], catch_exceptions=False)
     assert result.exit_code == 1
     assert "Error" in result.output
 
 
-@patch("release_mate.api.validate_git_repository")
-@patch("release_mate.api.version_worker")
-@patch("release_mate.api.get_project_config_file")
-@patch("pathlib.Path.exists")
-def test_version_command_dry_run(mock_exists, mock_get_config, mock_worker, mock_validate, cli_runner):
+def test_version_command_dry_run(patched_api):
     """Test version command in dry-run mode."""
-    mock_repo = MagicMock()
-    mock_repo.git.rev_parse.return_value = "/path/to/repo"
-    mock_validate.return_value = mock_repo
-    mock_exists.return_value = True
-
-    result = cli_runner.invoke(cli, [
-        "version",
-        "-i", "test",
-        "--noop"
-    ])
-    assert result.exit_code == 0
-    mock_worker.assert_called_once_with(
+    _invoke_version("-i", "test", "--noop")
+    patched_api.worker.assert_called_once_with(
         project_id="test",
         noop=True,
         print_version=False,
@@ -127,24 +168,10 @@ def test_version_command_dry_run(mock_exists, mock_get_config, mock_worker, mock
     )
 
 
-@patch("release_mate.api.validate_git_repository")
-@patch("release_mate.api.version_worker")
-@patch("release_mate.api.get_project_config_file")
-@patch("pathlib.Path.exists")
-def test_version_command_print_version(mock_exists, mock_get_config, mock_worker, mock_validate, cli_runner):
+def test_version_command_print_version(patched_api):
     """Test version command with print-version flag."""
-    mock_repo = MagicMock()
-    mock_repo.git.rev_parse.return_value = "/path/to/repo"
-    mock_validate.return_value = mock_repo
-    mock_exists.return_value = True
-
-    result = cli_runner.invoke(cli, [
-        "version",
-        "-i", "test",
-        "--print"
-    ])
-    assert result.exit_code == 0
-    mock_worker.assert_called_once_with(
+    _invoke_version("-i", "test", "--print")
+    patched_api.worker.assert_called_once_with(
         project_id="test",
         noop=False,
         print_version=True,
@@ -1,113 +1,55 @@
 """Test cases for CLI edge cases and remaining uncovered lines."""
-import os
-import subprocess
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
-from click.testing import CliRunner
 
-from release_mate.api import (get_git_info, get_normalized_project_dir,
-                              run_semantic_release,
-                              run_semantic_release_changelog)
+from release_mate import api
+from release_mate.api import get_normalized_project_dir
 from release_mate.cli import cli
 
+pytestmark = pytest.mark.usefixtures("stub_subprocess")
 
-@pytest.fixture
-def cli_runner():
-    """Create a CLI runner for testing click commands."""
-    return CliRunner()
 
-
-@pytest.fixture
-def mock_repo():
-    """Create a mock git repository."""
-    mock = MagicMock()
-    mock.active_branch.name = "main"
-    mock.git.rev_parse.return_value = "/mock/repo/path"
-    return mock
-
-
-def test_get_git_info_invalid_remote_url(mock_repo):
-    """Test get_git_info with invalid remote URL format."""
-    mock_repo.remote.return_value.urls = iter(["invalid://url"])
-    branch, url, domain, root = get_git_info(mock_repo)
-    assert branch == "main"
-    assert url == "invalid://url"
-    assert domain == ""
-    assert root == "/mock/repo/path"
-
-
-def test_run_semantic_release_directory_change(tmp_path):
-    """Test semantic-release maintains directory state after error."""
-    config_file = tmp_path / "test.toml"
-    config_file.touch()
-    original_dir = os.getcwd()
-
-    with patch("subprocess.run") as mock_run:
-        mock_run.side_effect = subprocess.CalledProcessError(
-            1, "semantic-release", "Error")
-        with pytest.raises(SystemExit) as exc_info:
-            run_semantic_release(config_file, ["--noop"], str(tmp_path))
-        assert exc_info.value.code == 1
-        assert os.getcwd() == original_dir
-
-
-def test_run_semantic_release_changelog_directory_change(tmp_path):
-    """Test semantic-release changelog maintains directory state after error."""
-    config_file = tmp_path / "test.toml"
-    config_file.touch()
-    original_dir = os.getcwd()
-
-    with patch("subprocess.run") as mock_run:
-        mock_run.side_effect = subprocess.CalledProcessError(
-            1, "semantic-release", "Error")
-        with pytest.raises(SystemExit) as exc_info:
-            run_semantic_release_changelog(
-                config_file, ["--noop"], str(tmp_path))
-        assert exc_info.value.code == 1
-        assert os.getcwd() == original_dir
+@pytest.fixture(scope="module")
+def release_mate_repo(tmp_path_factory):
+    """Build a repository root whose .release-mate holds a branchless and a feature project."""
+    repo_root = tmp_path_factory.mktemp("repo")
+    release_mate_dir = repo_root / ".release-mate"
+    release_mate_dir.mkdir()
+    (release_mate_dir / "test1.toml").write_text("[tool.semantic_release]\n")
+    (release_mate_dir / "test2.toml").write_text(
+        "[tool.semantic_release.branches.feature]\nmatch = 'feature'\n")
+    return repo_root
 
 
 def test_version_worker_git_error(cli_runner):
     """Test version worker with git error."""
-    with patch("release_mate.api.validate_git_repository") as mock_validate:
+    with patch.object(api, "validate_git_repository") as mock_validate:
         mock_validate.side_effect = Exception("Git error")
-        result = cli_runner.invoke(cli, ["version"])
+        result = cli_runner.invoke(cli, ["version"], catch_exceptions=False)
         assert result.exit_code == 1
 
 
-def test_batch_version_no_release_mate_dir(cli_runner, mock_repo):
+def test_batch_version_no_release_mate_dir(cli_runner, fake_repo):
     """Test batch version when .release-mate directory doesn't exist."""
-    with patch("release_mate.api.validate_git_repository") as mock_validate, \
-            patch("pathlib.Path.glob") as mock_glob:
+    with patch.object(api, "validate_git_repository") as mock_validate, \
+            patch.object(api, "_iter_project_configs") as mock_configs:
 
-        mock_validate.return_value = mock_repo
-        mock_glob.return_value = []
+        mock_validate.return_value = fake_repo
+        mock_configs.return_value = []
 
-        result = cli_runner.invoke(cli, ["batch-version"])
+        result = cli_runner.invoke(cli, ["batch-version"], catch_exceptions=False)
         assert result.output == ""  # No output when no projects are found
 
 
-def test_batch_version_branch_switch_error(cli_runner, mock_repo):
+def test_batch_version_branch_switch_error(cli_runner, fake_repo, release_mate_repo):
     """Test batch version with branch switch error."""
-    with patch("release_mate.api.validate_git_repository") as mock_validate, \
-            patch("pathlib.Path.glob") as mock_glob, \
-            patch("release_mate.api.identify_branch") as mock_identify, \
-            patch("release_mate.api.get_project_config_file") as mock_get_config, \
-            patch("pathlib.Path.exists") as mock_exists:
-
-        mock_validate.return_value = mock_repo
-        mock_glob.return_value = [
-            Path("/mock/repo/path/.release-mate/test.toml")]
-        mock_identify.return_value = "feature"
-        mock_get_config.return_value = Path(
-            "/mock/repo/path/.release-mate/test.toml")
-        mock_repo.git.checkout.side_effect = Exception("Checkout error")
-        mock_exists.return_value = True
-
-        result = cli_runner.invoke(cli, ["batch-version"])
-        assert "Exception: Checkout error" in result.output
+    fake_repo.working_tree_dir = str(release_mate_repo)
+    fake_repo.git.checkout.side_effect = Exception("Checkout error")
+    with patch.object(api, "validate_git_repository", return_value=fake_repo):
+        result = cli_runner.invoke(cli, ["batch-version"], catch_exceptions=False)
+    assert "Exception: Checkout error" in result.output
 
 
 def test_get_normalized_project_dir_nonexistent(tmp_path):
@@ -117,16 +59,15 @@ def test_get_normalized_project_dir_nonexistent(tmp_path):
             str(tmp_path / "nonexistent"), str(tmp_path))
 
 
-def test_version_worker_multiple_errors(cli_runner, mock_repo):
+def test_version_worker_multiple_errors(cli_runner, fake_repo, mock_config_path,
+                                        monkeypatch):
     """Test version worker with multiple error conditions."""
-    with patch("release_mate.api.validate_git_repository") as mock_validate, \
-            patch("release_mate.api.get_project_config_file") as mock_get_config, \
-            patch("pathlib.Path.exists") as mock_exists:
+    monkeypatch.setattr(Path, "exists", lambda self: True)
+    with patch.object(api, "validate_git_repository") as mock_validate, \
+            patch.object(api, "get_project_config_file") as mock_get_config:
 
-        mock_validate.return_value = mock_repo
-        mock_get_config.return_value = Path(
-            "/mock/repo/path/.release-mate/test.toml")
-        mock_exists.return_value = True
+        mock_validate.return_value = fake_repo
+        mock_get_config.return_value = mock_config_path
 
         # Test multiple print flags
         result = cli_runner.invoke(cli, [
@@ -134,50 +75,32 @@ def test_version_worker_multiple_errors(cli_runner, mock_repo):
             "--print",
             "--print-tag",
             "-i", "test"
-        ])
+        ], catch_exceptions=False)
         assert result.exit_code == 1
         assert "Only one print flag can be specified at a time" in result.output
 
-        # Test multiple version flags
-        result = cli_runner.invoke(cli, [
-            "version",
-            "--major",
-            "--minor",
-            "-i", "test"
-        ])
-        assert result.exit_code == 1
-        assert "Only one version type flag can be specified at a time" in result.output
-
 
+@pytest.mark.usefixtures("api_stubs")
 def test_batch_version_multiple_version_flags(cli_runner):
     """Test batch version with multiple version flags."""
     result = cli_runner.invoke(cli, [
         "batch-version",
         "--major",
         "--minor"
-    ])
+    ], catch_exceptions=False)
     assert result.exit_code == 1
     assert "Only one version type flag can be specified at a time" in result.output
 
 
-def test_batch_version_with_errors(cli_runner, mock_repo):
+def test_batch_version_with_errors(cli_runner, fake_repo, release_mate_repo):
     """Test batch version with various error conditions."""
-    with patch("release_mate.api.validate_git_repository") as mock_validate, \
-            patch("pathlib.Path.glob") as mock_glob, \
-            patch("release_mate.api.identify_branch") as mock_identify, \
-            patch("release_mate.api.get_project_config_file") as mock_get_config:
-
-        mock_validate.return_value = mock_repo
-        mock_glob.return_value = [
-            Path("/mock/repo/path/.release-mate/test1.toml"),
-            Path("/mock/repo/path/.release-mate/test2.toml")
-        ]
-
-        # First project succeeds, second fails
-        mock_identify.side_effect = [None, "main"]
-        mock_get_config.return_value = Path(
-            "/mock/repo/path/.release-mate/test2.toml")
-
-        result = cli_runner.invoke(cli, ["batch-version"])
-        assert result.exit_code == 1
-        assert "Project 'test2' does not exist in .release-mate directory" in result.output
+    fake_repo.working_tree_dir = str(release_mate_repo)
+    with patch.object(api, "validate_git_repository", return_value=fake_repo), \
+            patch.object(api, "run_semantic_release") as mock_run:
+        result = cli_runner.invoke(cli, ["batch-version"], catch_exceptions=False)
+
+    # The branchless project is only a warning; the other one is still released
+    assert result.exit_code == 0
+    assert "Could not determine branch for project test1" in result.output
+    fake_repo.git.checkout.assert_any_call("feature")
+    mock_run.assert_called_once()
@@ -1,125 +1,101 @@
 """Test cases for CLI error handling scenarios."""
+import os
 import subprocess
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
-from click.testing import CliRunner
 from git.exc import GitCommandError
 
+from release_mate import api
 from release_mate.api import (get_git_info, run_semantic_release,
                               run_semantic_release_changelog, version_worker)
 
-
-@pytest.fixture
-def cli_runner():
-    """Create a CLI runner for testing click commands."""
-    return CliRunner()
-
-
-@pytest.fixture
-def mock_repo():
-    """Create a mock git repository."""
-    mock = MagicMock()
-    mock.active_branch.name = "main"
-    mock.git.rev_parse.return_value = "/mock/repo/path"
-    return mock
-
-
-def test_get_git_info_no_remote(mock_repo):
-    """Test get_git_info when no remote is configured."""
-    mock_repo.remote.side_effect = GitCommandError("git remote", 128)
-    branch, url, domain, root = get_git_info(mock_repo)
+pytestmark = pytest.mark.usefixtures("stub_subprocess")
+
+
+@pytest.mark.parametrize("url,expected_domain", [
+    ("https://github.com/user/repo.git", "https://github.com"),
+    ("git@github.com:user/repo.git", "https://github.com"),
+    ("ssh://git@gitlab.example.com:2222/user/repo.git", "https://gitlab.example.com"),
+    ("invalid://url", ""),
+    ("malformed://url", ""),
+    (None, ""),
+])
+def test_get_git_info(mock_repo, url, expected_domain):
+    """Test get_git_info derives the domain from each remote URL format."""
+    if url is None:
+        # No remote configured
+        mock_repo.remote.side_effect = GitCommandError("git remote", 128)
+    else:
+        mock_repo.remote.return_value.urls = [url]
+    branch, remote_url, domain, root = get_git_info(mock_repo)
     assert branch == "main"
-    assert url == ""
-    assert domain == ""
+    assert remote_url == (url or "")
+    assert domain == expected_domain
     assert root == "/mock/repo/path"
 
 
-def test_run_semantic_release_error(tmp_path):
-    """Test semantic-release execution with error."""
-    config_file = tmp_path / "test.toml"
-    config_file.touch()
-
-    with patch("subprocess.run") as mock_run:
-        mock_run.side_effect = subprocess.CalledProcessError(
-            1, "semantic-release", stderr="Error occurred")
-        with pytest.raises(SystemExit):
-            run_semantic_release(config_file, ["--noop"], str(tmp_path))
-
-
-def test_run_semantic_release_changelog_error(tmp_path):
-    """Test semantic-release changelog execution with error."""
-    config_file = tmp_path / "test.toml"
-    config_file.touch()
-
-    with patch("subprocess.run") as mock_run:
-        mock_run.side_effect = subprocess.CalledProcessError(
-            1, "semantic-release", stderr="Error occurred")
-        with pytest.raises(SystemExit):
-            run_semantic_release_changelog(
-                config_file, ["--noop"], str(tmp_path))
-
-
-def test_version_worker_multiple_print_flags(cli_runner, mock_repo):
+@pytest.mark.parametrize("func", [run_semantic_release, run_semantic_release_changelog])
+@pytest.mark.parametrize("stdout,stderr,side_effect", [
+    ("Version updated", "", None),
+    ("", "Warning: something happened", None),
+    ("Success output", "Warning message", None),
+    ("", "", subprocess.CalledProcessError(1, "semantic-release", stderr="Error occurred")),
+    ("", "", subprocess.CalledProcessError(1, "semantic-release", "Error")),
+])
+def test_run_semantic_release(tmp_path, stub_subprocess, func, stdout, stderr, side_effect):
+    """Test semantic-release runs succeed, exit on failure, and leave the working directory alone."""
+    original_dir = os.getcwd()
+    stub_subprocess.return_value.stdout = stdout
+    stub_subprocess.return_value.stderr = stderr
+    stub_subprocess.side_effect = side_effect
+
+    if side_effect is None:
+        func(tmp_path / "test.toml", ["--noop"], str(tmp_path))
+    else:
+        with pytest.raises(SystemExit) as exc_info:
+            func(tmp_path / "test.toml", ["--noop"], str(tmp_path))
+        assert exc_info.value.code == 1
+    stub_subprocess.assert_called_once()
+    assert os.getcwd() == original_dir
+
+
+def test_version_worker_multiple_print_flags(patched_version_deps, capsys):
     """Test version worker with multiple print flags (should fail)."""
-    with patch("release_mate.api.validate_git_repository") as mock_validate:
-        mock_validate.return_value = mock_repo
-        with pytest.raises(SystemExit):
-            version_worker(
-                project_id="test",
-                print_version=True,
-                print_tag=True
-            )
-
-
-def test_version_worker_multiple_version_flags(cli_runner, mock_repo):
+    with pytest.raises(SystemExit) as exc_info:
+        version_worker(
+            project_id="test",
+            print_version=True,
+            print_tag=True
+        )
+    assert exc_info.value.code == 1
+    assert "Only one print flag can be specified at a time" in capsys.readouterr().out
+    patched_version_deps.run.assert_not_called()
+
+
+def test_version_worker_multiple_version_flags(patched_version_deps, capsys):
     """Test version worker with multiple version flags (should fail)."""
-    with patch("release_mate.api.validate_git_repository") as mock_validate:
-        mock_validate.return_value = mock_repo
-        with pytest.raises(SystemExit):
-            version_worker(
-                project_id="test",
-                major=True,
-                minor=True
-            )
-
-
-def test_version_worker_nonexistent_project(cli_runner, mock_repo):
+    with pytest.raises(SystemExit) as exc_info:
+        version_worker(
+            project_id="test",
+            major=True,
+            minor=True
+        )
+    assert exc_info.value.code == 1
+    assert "Only one version type flag can be specified at a time" in capsys.readouterr().out
+    patched_version_deps.run.assert_not_called()
+
+
+def test_version_worker_nonexistent_project(fake_repo, mock_config_path, monkeypatch):
     """Test version worker with non-existent project."""
-    with patch("release_mate.api.validate_git_repository") as mock_validate, \
-            patch("release_mate.api.get_project_config_file") as mock_get_config:
+    with patch.object(api, "validate_git_repository") as mock_validate, \
+            patch.object(api, "get_project_config_file") as mock_get_config:
 
-        mock_validate.return_value = mock_repo
-        config_file = Path("/mock/repo/path/.release-mate/test.toml")
-        mock_get_config.return_value = config_file
+        mock_validate.return_value = fake_repo
+        mock_get_config.return_value = mock_config_path
 
         # Simulate non-existent project
-        with patch.object(Path, "exists") as mock_exists:
-            mock_exists.return_value = False
-            with pytest.raises(SystemExit):
-                version_worker(project_id="nonexistent")
-
-
-def test_run_semantic_release_with_stderr(tmp_path):
-    """Test semantic-release execution with stderr output."""
-    config_file = tmp_path / "test.toml"
-    config_file.touch()
-
-    with patch("subprocess.run") as mock_run:
-        mock_run.return_value.stdout = ""
-        mock_run.return_value.stderr = "Warning: something happened"
-        run_semantic_release(config_file, ["--noop"], str(tmp_path))
-        mock_run.assert_called_once()
-
-
-def test_run_semantic_release_changelog_with_stderr(tmp_path):
-    """Test semantic-release changelog execution with stderr output."""
-    config_file = tmp_path / "test.toml"
-    config_file.touch()
-
-    with patch("subprocess.run") as mock_run:
-        mock_run.return_value.stdout = ""
-        mock_run.return_value.stderr = "Warning: something happened"
-        run_semantic_release_changelog(config_file, ["--noop"], str(tmp_path))
-        mock_run.assert_called_once()
+        monkeypatch.setattr(Path, "exists", lambda self: False)
+        with pytest.raises(SystemExit):
+            version_worker(project_id="nonexistent")
@@ -0,0 +1,185 @@
+"""Test cases for the release-mate-fast daemon."""
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from release_mate import daemon
+
+
+def test_daemon_falls_back_to_cli_when_disabled(monkeypatch):
+    """Test release-mate-fast runs the CLI in-process without RELEASE_MATE_DAEMON."""
+    monkeypatch.delenv("RELEASE_MATE_DAEMON", raising=False)
+    with patch("release_mate.cli.cli") as mock_cli, \
+            patch("release_mate.daemon._connect") as mock_connect:
+        daemon.main()
+    mock_cli.assert_called_once_with(prog_name="release-mate")
+    mock_connect.assert_not_called()
+
+
+def test_daemon_request_round_trip(tmp_path, monkeypatch):
+    """Test argv, cwd, env and file descriptors survive the daemon protocol."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("RELEASE_MATE_TEST", "1")
+    client, server = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+    read_fd, write_fd = os.pipe()
+    try:
+        daemon.send_request(client, ["version", "-i", "proj"], [write_fd])
+        request, fds = daemon.recv_request(server)
+        assert request["argv"] == ["version", "-i", "proj"]
+        assert request["cwd"] == str(tmp_path)
+        assert request["env"]["RELEASE_MATE_TEST"] == "1"
+        assert len(fds) == 1
+        os.write(fds[0], b"ok")
+        os.close(fds[0])
+        assert os.read(read_fd, 2) == b"ok"
+    finally:
+        client.close()
+        server.close()
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_socket_path_creates_private_dir(tmp_path, monkeypatch):
+    """Test the socket goes into a 0700 per-user directory without XDG_RUNTIME_DIR."""
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+    path = daemon.socket_path()
+    socket_dir = os.path.dirname(path)
+    assert os.path.dirname(socket_dir) == str(tmp_path)
+    assert os.stat(socket_dir).st_mode & 0o777 == 0o700
+
+
+def test_socket_path_rejects_shared_dir(tmp_path, monkeypatch):
+    """Test a runtime directory other users can access disables the daemon."""
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o777)
+    shared.chmod(0o777)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(shared))
+    assert daemon.socket_path() is None
+
+
+def test_connect_rejects_socket_of_other_user(tmp_path, monkeypatch):
+    """Test the client never talks to a socket owned by someone else."""
+    path = str(tmp_path / "daemon.sock")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        listener.bind(path)
+        listener.listen()
+        assert daemon._connect(path) is not None
+        monkeypatch.setattr(os, "getuid", lambda: os.stat(path).st_uid + 1)
+        assert daemon._connect(path) is None
+    finally:
+        listener.close()
+
+
+def test_daemon_runs_in_process_without_private_socket(monkeypatch):
+    """Test release-mate-fast falls back to the CLI when no safe socket path exists."""
+    monkeypatch.setenv("RELEASE_MATE_DAEMON", "1")
+    with patch("release_mate.daemon.socket_path", return_value=None), \
+            patch("release_mate.cli.cli") as mock_cli, \
+            patch("release_mate.daemon._start_server") as mock_start:
+        daemon.main()
+    mock_cli.assert_called_once_with(prog_name="release-mate")
+    mock_start.assert_not_called()
+
+
+def test_run_request_reports_failing_subprocess(tmp_path, monkeypatch):
+    """Test a failing subprocess in a forked request child reaches the client as its exit code."""
+    def failing_main(args, prog_name):
+        try:
+            subprocess.run([sys.executable, "-c", "raise SystemExit(3)"], check=True)
+        except subprocess.CalledProcessError as e:
+            sys.exit(e.returncode)
+
+    monkeypatch.setattr("release_mate.cli.cli.main", failing_main)
+    request = {"argv": [], "cwd": str(tmp_path), "env": dict(os.environ)}
+    client, server = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+    fds = [os.open(os.devnull, os.O_RDWR) for _ in range(3)]
+
+    # The server ignores SIGCHLD; the child inherits that across fork
+    previous = signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    pid = os.fork()
+    if pid == 0:
+        client.close()
+        daemon._run_request(server, request, fds)
+    signal.signal(signal.SIGCHLD, previous)
+    try:
+        server.close()
+        for fd in fds:
+            os.close(fd)
+        exit_code, = daemon._EXIT_CODE.unpack(
+            daemon._recv_exactly(client, daemon._EXIT_CODE.size))
+        assert exit_code == 3
+    finally:
+        client.close()
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+
+
+def test_serve_drops_client_that_never_sends_a_request(tmp_path, monkeypatch):
+    """Test a connected but silent client does not block the requests after it."""
+    path = str(tmp_path / "daemon.sock")
+    monkeypatch.setattr(daemon, "REQUEST_TIMEOUT", 0.2)
+    monkeypatch.setattr(daemon, "IDLE_TIMEOUT", 30)
+    pid = os.fork()
+    if pid == 0:
+        try:
+            daemon.serve(path)
+        finally:
+            os._exit(0)
+    try:
+        silent = None
+        for _ in range(200):
+            silent = daemon._connect(path)
+            if silent is not None:
+                break
+            time.sleep(0.05)
+        assert silent is not None
+
+        with silent, daemon._connect(path) as client:
+            client.settimeout(10)
+            devnull = os.open(os.devnull, os.O_RDWR)
+            try:
+                daemon.send_request(client, ["--version"], [devnull] * 3)
+            finally:
+                os.close(devnull)
+            exit_code, = daemon._EXIT_CODE.unpack(
+                daemon._recv_exactly(client, daemon._EXIT_CODE.size))
+        assert exit_code == 0
+    finally:
+        os.kill(pid, signal.SIGTERM)
+        os.waitpid(pid, 0)
+
+
+def test_daemon_reports_lost_connection(monkeypatch, capsys):
+    """Test release-mate-fast exits with a one-line error when the daemon dies mid-request."""
+    monkeypatch.setenv("RELEASE_MATE_DAEMON", "1")
+    client, server = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    def die_after_request():
+        # Read the request, then close without reporting an exit code
+        _, fds = daemon.recv_request(server)
+        for fd in fds:
+            os.close(fd)
+        server.close()
+
+    worker = threading.Thread(target=die_after_request)
+    worker.start()
+    with patch("release_mate.daemon.socket_path", return_value="daemon.sock"), \
+            patch("release_mate.daemon._connect", return_value=client), \
+            pytest.raises(SystemExit) as exc_info:
+        daemon.main()
+    worker.join()
+
+    assert exc_info.value.code == 1
+    err = capsys.readouterr().err
+    assert err.strip() == "release-mate-fast: lost the connection to the daemon before the command finished"
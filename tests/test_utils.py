@@ -2,7 +2,10 @@
 import os
 from pathlib import Path
 
-from release_mate.api import (get_project_config_file, get_relative_path,
+import pytest
+
+from release_mate.api import (build_version_args, display_panel_message,
+                              get_project_config_file, get_relative_path,
                               identify_branch)
 
 
@@ -26,28 +29,21 @@ def test_get_relative_path_different_drive():
             root, target) == "../../../other/path/file.txt"
 
 
-def test_identify_branch_empty_file(tmp_path):
-    """Test identifying branch from empty file."""
-    config = tmp_path / "empty.toml"
-    config.touch()
-    assert identify_branch(config) is None
-
-
-def test_identify_branch_invalid_toml(tmp_path):
-    """Test identifying branch from invalid TOML file."""
-    config = tmp_path / "invalid.toml"
-    config.write_text("invalid toml content")
-    branch = identify_branch(config)
-    assert branch is None
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory):
+    """One directory for tests that each write a differently named file."""
+    return tmp_path_factory.mktemp("rm")
 
 
-def test_identify_branch_no_branch(tmp_path):
-    """Test identifying branch when no branch is configured."""
-    config = tmp_path / "no_branch.toml"
-    config.write_text("""
-[tool.semantic_release]
-version_variable = "package/__init__.py:__version__"
-""")
+@pytest.mark.parametrize("name, content", [
+    ("empty.toml", ""),
+    ("invalid.toml", "invalid toml content"),
+    ("no_branch.toml", '[tool.semantic_release]\nversion_variable = "package/__init__.py:__version__"\n'),
+], ids=["empty", "invalid", "no_branch"])
+def test_identify_branch_returns_none(shared_tmp, name, content):
+    """Test identifying branch from files without a branch section."""
+    config = shared_tmp / name
+    config.write_text(content)
     assert identify_branch(config) is None
 
 
@@ -58,42 +54,23 @@ def test_get_project_config_file_relative_path():
     assert str(result) == "relative/path/.release-mate/test.toml"
 
 
-def test_build_version_args_all_flags():
-    """Test building version arguments with all flags enabled."""
-    from release_mate.api import build_version_args
-    args = build_version_args(True, True, False, False,
-                              False, True, True, True, True)
-    assert "--noop" in args
-    assert "--major" in args
-
-
-def test_build_version_args_no_flags():
-    """Test building version arguments with no flags enabled."""
-    from release_mate.api import build_version_args
-    args = build_version_args(
-        False, False, False, False, False, True, True, True, True)
-    assert "--noop" not in args
-    assert "--major" not in args
-    assert "--minor" not in args
-    assert "--patch" not in args
-    assert "--prerelease" not in args
-
-
-def test_display_panel_message_long_text():
-    """Test displaying panel message with long text."""
-    from release_mate.api import display_panel_message
-    long_text = "A" * 100
-    display_panel_message("Test", long_text)
-
-
-def test_display_panel_message_special_chars():
-    """Test displaying panel message with special characters."""
-    from release_mate.api import display_panel_message
-    special_chars = "!@#$%^&*()"
-    display_panel_message("Test", special_chars)
-
-
-def test_display_panel_message_empty():
-    """Test displaying panel message with empty text."""
-    from release_mate.api import display_panel_message
-    display_panel_message("Test", "")
+@pytest.mark.parametrize("flags, expected_present, expected_absent", [
+    ((True, True, False, False, False, True, True, True, True),
+     ["--noop", "--major"], []),
+    ((False, False, False, False, False, True, True, True, True),
+     [], ["--noop", "--major", "--minor", "--patch", "--prerelease"]),
+], ids=["noop_major", "no_flags"])
+def test_build_version_args(flags, expected_present, expected_absent):
+    """Test building version arguments from positional flags."""
+    args = build_version_args(*flags)
+    for flag in expected_present:
+        assert flag in args
+    for flag in expected_absent:
+        assert flag not in args
+
+
+@pytest.mark.parametrize("text", ["A" * 100, "!@#$%^&*()", ""],
+                         ids=["long", "special", "empty"])
+def test_display_panel_message(text):
+    """Test displaying panel messages with unusual text."""
+    display_panel_message("Test", text)